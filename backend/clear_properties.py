@@ -5,13 +5,19 @@ import asyncio
 from motor.motor_asyncio import AsyncIOMotorClient
 import os
 from dotenv import load_dotenv
+from typing import Optional
 
 load_dotenv()
 
-async def clear_properties():
-    """Clear all properties from the database"""
-    mongo_uri = os.getenv("MONGO_URI", "mongodb://localhost:27017")
-    client = AsyncIOMotorClient(mongo_uri)
+async def clear_properties(client: Optional[AsyncIOMotorClient] = None):
+    """
+    Clear all properties from the database
+    Reuses the given client if provided; otherwise opens (and closes) its own
+    """
+    owns_client = client is None
+    if owns_client:
+        mongo_uri = os.getenv("MONGO_URI", "mongodb://localhost:27017")
+        client = AsyncIOMotorClient(mongo_uri)
     db = client.get_database("hocs")
     
     # Clear properties collection
@@ -22,7 +28,8 @@ async def clear_properties():
     result = await db.sessions.delete_many({})
     print(f"✓ Deleted {result.deleted_count} sessions from database")
     
-    client.close()
+    if owns_client:
+        client.close()
     print("✓ Database cleared successfully")
 
 if __name__ == "__main__":
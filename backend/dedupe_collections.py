@@ -0,0 +1,55 @@
+"""
+Script to remove duplicate documents that would block the unique indexes created at startup
+Run once against an existing database before deploying the unique indexes
+"""
+import asyncio
+from motor.motor_asyncio import AsyncIOMotorClient
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Collection -> fields of the unique index created in main.py's lifespan
+UNIQUE_KEYS = {
+    "properties": ("address",),
+    "waitlist": ("email", "address"),
+    "email_subscriptions": ("email",),
+}
+
+async def dedupe_collection(db, collection_name: str, fields: tuple):
+    """Keep the earliest document for each unique key and delete the rest"""
+    collection = db.get_collection(collection_name)
+    
+    pipeline = [
+        {"$sort": {"_id": 1}},
+        {"$group": {
+            "_id": {field: f"${field}" for field in fields},
+            "ids": {"$push": "$_id"},
+            "count": {"$sum": 1}
+        }},
+        {"$match": {"count": {"$gt": 1}}}
+    ]
+    
+    duplicate_ids = []
+    async for group in collection.aggregate(pipeline, allowDiskUse=True):
+        duplicate_ids.extend(group["ids"][1:])
+    
+    if duplicate_ids:
+        result = await collection.delete_many({"_id": {"$in": duplicate_ids}})
+        print(f"✓ Deleted {result.deleted_count} duplicate documents from {collection_name}")
+    else:
+        print(f"✓ No duplicates in {collection_name}")
+
+async def dedupe_collections():
+    """Remove duplicates from every collection that gets a unique index"""
+    mongo_uri = os.getenv("MONGO_URI", "mongodb://localhost:27017")
+    client = AsyncIOMotorClient(mongo_uri)
+    db = client.get_database("hocs")
+    
+    for collection_name, fields in UNIQUE_KEYS.items():
+        await dedupe_collection(db, collection_name, fields)
+    
+    client.close()
+
+if __name__ == "__main__":
+    asyncio.run(dedupe_collections())
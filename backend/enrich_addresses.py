@@ -0,0 +1,34 @@
+"""
+Script to backfill the lowercased address field on existing addresses
+"""
+import asyncio
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
+import os
+from dotenv import load_dotenv
+
+from services.address_service import enrich_address
+
+load_dotenv()
+
+async def enrich_addresses():
+    """Write address_lc onto address documents that don't have it yet"""
+    mongo_uri = os.getenv("MONGO_URI", "mongodb://localhost:27017")
+    client = AsyncIOMotorClient(mongo_uri)
+    db = client.get_database("hocs")
+    
+    # Compute derived fields for each address missing them
+    operations = []
+    async for doc in db.addresses.find({"address_lc": {"$exists": False}}, {"address": 1}):
+        operations.append(UpdateOne({"_id": doc["_id"]}, {"$set": enrich_address(doc["address"])}))
+    
+    if operations:
+        result = await db.addresses.bulk_write(operations, ordered=False)
+        print(f"✓ Enriched {result.modified_count} of {len(operations)} addresses")
+    else:
+        print("✓ No addresses to enrich")
+    
+    client.close()
+
+if __name__ == "__main__":
+    asyncio.run(enrich_addresses())
@@ -1,29 +1,39 @@
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response
 from motor.motor_asyncio import AsyncIOMotorClient
-from datetime import datetime, timedelta
+from pymongo import ReturnDocument
+from bson import Binary
+from pymongo.errors import DuplicateKeyError, OperationFailure
+from datetime import datetime, timedelta, timezone
 import os
+import json
 from dotenv import load_dotenv
-from typing import List
+from typing import Dict, Final, List, NamedTuple, Optional, Tuple
 import re
-import random
+import zlib
+import time
+import asyncio
+import multiprocessing
 from uuid import uuid4
-from io import BytesIO
 from pydantic import BaseModel, EmailStr
 from contextlib import asynccontextmanager
+from concurrent.futures import ProcessPoolExecutor
+from cachetools import TTLCache
 
 from models import (
     PropertyData,
     SavingsOpportunity,
+    OpportunityListAdapter,
+    construct_opportunity,
     PropertyLookupRequest,
     PropertyLookupResponse,
     Session
 )
 from services.opportunity_service import generate_opportunities
 from services.pdf_service import generate_report_pdf
-from services.email_service import send_report_email
-from services.utility_lookup_service import UtilityLookupService
+from services.email_service import ensure_email_configured, send_report_email, wait_for_pending_writes
+from services.address_service import extract_city, lookup_city_providers, utility_lookup
 from services.utility_program_service import UtilityProgramService
 
 # Load environment variables
@@ -33,23 +43,111 @@ load_dotenv()
 mongo_client = None
 db = None
 
+# Collection handles, bound once at startup
+properties_collection = None
+sessions_collection = None
+addresses_collection = None
+waitlist_collection = None
+pdf_cache_collection = None
+
+# In-process cache of PropertyLookup results keyed by address
+property_cache: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+property_locks: Dict[str, asyncio.Lock] = {}
+
+# Most recent (monotonic time, database status) from the health check ping
+HEALTH_CHECK_TTL_SECONDS = 5.0
+last_health_check: Tuple[float, str] = (float("-inf"), "disconnected")
+
+# Autocomplete suggestions keyed by lowercased query; the TTL picks up reseeded addresses
+autocomplete_cache: TTLCache = TTLCache(maxsize=1024, ttl=300)
+
+# Short-lived cache of parsed sessions keyed by session_id
+session_cache: TTLCache = TTLCache(maxsize=1000, ttl=60)
+
+# Process pool for CPU-bound ReportLab rendering, kept off the event loop
+pdf_executor: Optional[ProcessPoolExecutor] = None
+
+
+async def create_unique_index(collection, keys, **kwargs) -> None:
+    """
+    Create a unique index, logging instead of aborting startup when documents
+    written before the index existed still hold duplicate keys
+    """
+    try:
+        await collection.create_index(keys, unique=True, **kwargs)
+    except OperationFailure as e:
+        print(f"✗ Unique index on {collection.name} {keys} not created, run dedupe_collections.py: {str(e)}")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for startup and shutdown events"""
-    global mongo_client, db
+    global mongo_client, db, pdf_executor
+    global properties_collection, sessions_collection
+    global addresses_collection, waitlist_collection, pdf_cache_collection
     
     # Startup: Initialize MongoDB connection
     mongo_uri = os.getenv("MONGO_URI", "mongodb://localhost:27017")
-    mongo_client = AsyncIOMotorClient(mongo_uri)
+    mongo_client = AsyncIOMotorClient(
+        mongo_uri,
+        maxPoolSize=int(os.getenv("MONGO_MAX_POOL", "50")),
+        minPoolSize=int(os.getenv("MONGO_MIN_POOL", "10")),
+        maxIdleTimeMS=300_000,
+        serverSelectionTimeoutMS=3000,
+        retryWrites=True,
+        tz_aware=True
+    )
     db = mongo_client.get_database("hocs")
+    properties_collection = db.properties
+    sessions_collection = db.sessions
+    addresses_collection = db.addresses
+    waitlist_collection = db.waitlist
+    pdf_cache_collection = db.pdf_cache
+    
+    # Warm the connection pool so the first requests don't pay the handshake cost
+    await mongo_client.admin.command("ping")
     
     # Create TTL index on sessions collection
-    await db.sessions.create_index("expires_at", expireAfterSeconds=0)
+    await sessions_collection.create_index("expires_at", expireAfterSeconds=0)
     print("✓ MongoDB connected and TTL index created on sessions.expires_at")
     
+    # Unique index for session lookups by session_id
+    await sessions_collection.create_index([("session_id", 1)], unique=True)
+    await sessions_collection.create_index([("session_id", 1), ("expires_at", 1)])
+    
+    # Unique address index makes the property upsert idempotent
+    await create_unique_index(properties_collection, "address")
+    
+    # Rendered PDFs are cached per session and expire with it
+    await pdf_cache_collection.create_index("session_id", unique=True)
+    await pdf_cache_collection.create_index("expires_at", expireAfterSeconds=0)
+    
+    # Unique (email, address) index makes waitlist signups idempotent
+    await create_unique_index(waitlist_collection, [("email", 1), ("address", 1)])
+    
+    # Unique email index backs the subscription upserts in the email service
+    await create_unique_index(db.email_subscriptions, "email")
+    
+    # address_lc is written by seed_data.py / enrich_addresses.py; the index backs anchored prefix autocomplete
+    await addresses_collection.create_index("address_lc")
+    await addresses_collection.create_index([("address", "text")])
+    print("✓ Prefix and text indexes created on addresses")
+    
+    # Forkserver workers don't inherit Motor's threads and locks from this process
+    pdf_executor = ProcessPoolExecutor(
+        max_workers=int(os.getenv("PDF_WORKERS", "2")),
+        mp_context=multiprocessing.get_context("forkserver")
+    )
+    
     yield
     
+    # Let in-flight subscription writes finish before the client goes away
+    await wait_for_pending_writes()
+    
+    # Shutdown: Stop the PDF workers; running renders finish off the event loop
+    if pdf_executor:
+        await asyncio.to_thread(pdf_executor.shutdown, cancel_futures=True)
+    
     # Shutdown: Close MongoDB connection
     if mongo_client:
         mongo_client.close()
@@ -86,20 +184,26 @@ async def health_check():
     Health check endpoint that verifies database connectivity
     Returns status, database connection state, and timestamp
     """
-    database_status = "disconnected"
+    global last_health_check
     
-    try:
-        # Ping the database to verify connection
-        if mongo_client:
-            await mongo_client.admin.command('ping')
-            database_status = "connected"
-    except Exception as e:
-        database_status = f"error: {str(e)}"
+    # Reuse the last ping result for a few seconds so frequent probes don't hit MongoDB
+    now = time.monotonic()
+    checked_at, database_status = last_health_check
+    if now - checked_at >= HEALTH_CHECK_TTL_SECONDS:
+        database_status = "disconnected"
+        try:
+            # Ping the database to verify connection
+            if mongo_client:
+                await mongo_client.admin.command('ping')
+                database_status = "connected"
+        except Exception as e:
+            database_status = f"error: {str(e)}"
+        last_health_check = (now, database_status)
     
     return {
         "status": "ok",
         "database": database_status,
-        "timestamp": datetime.utcnow().isoformat() + "Z"
+        "timestamp": datetime.now(timezone.utc).isoformat()
     }
 
 
@@ -109,6 +213,38 @@ async def root():
     return {"message": "HOCS Backend API", "version": "1.0.0"}
 
 
+# Characters with operator meaning in a $text search string
+TEXT_SEARCH_OPERATORS: Final = str.maketrans('-"', "  ")
+
+
+async def search_addresses(normalized_query: str) -> List[str]:
+    """Query the addresses collection for up to 10 suggestions for a lowercased query"""
+    tokens = normalized_query.split()
+    # '-' (negation) and '"' (phrase) are $search operators, so they are dropped from the words
+    search_words = " ".join(tokens[:-1]).translate(TEXT_SEARCH_OPERATORS).split()
+    
+    if search_words and len(tokens[-1]) >= 2:
+        # Multi-word query: text index narrows candidates on the complete words,
+        # then the partially typed last word refines them
+        cursor = addresses_collection.find(
+            {
+                "$text": {"$search": " ".join(search_words)},
+                "address_lc": {"$regex": r"\b" + re.escape(tokens[-1])}
+            },
+            {"address": 1, "_id": 0, "score": {"$meta": "textScore"}}
+        ).sort([("score", {"$meta": "textScore"})]).limit(10)
+    else:
+        # Anchored regex on the lowercased field is bounded by the address_lc index
+        regex_pattern = "^" + re.escape(normalized_query)
+        cursor = addresses_collection.find(
+            {"address_lc": {"$regex": regex_pattern}},
+            {"address": 1, "_id": 0}
+        ).limit(10)
+    
+    results = await cursor.to_list(length=10)
+    return [doc["address"] for doc in results]
+
+
 @app.get("/api/v1/addresses/autocomplete")
 async def autocomplete_addresses(query: str = Query(..., min_length=1)):
     """
@@ -116,18 +252,12 @@ async def autocomplete_addresses(query: str = Query(..., min_length=1)):
     Returns LA County address suggestions based on query string
     """
     try:
-        # Search addresses collection with case-insensitive regex
-        addresses_collection = db.addresses
-        
-        # Use regex for case-insensitive partial matching
-        regex_pattern = re.escape(query)
-        cursor = addresses_collection.find(
-            {"address": {"$regex": regex_pattern, "$options": "i"}},
-            {"address": 1, "_id": 0}
-        ).limit(10)
-        
-        results = await cursor.to_list(length=10)
-        suggestions = [doc["address"] for doc in results]
+        # Repeated keystroke prefixes are served from the in-process cache
+        normalized_query = query.lower()
+        suggestions = autocomplete_cache.get(normalized_query)
+        if suggestions is None:
+            suggestions = await search_addresses(normalized_query)
+            autocomplete_cache[normalized_query] = suggestions
         
         return {"suggestions": suggestions}
     
@@ -135,91 +265,91 @@ async def autocomplete_addresses(query: str = Query(..., min_length=1)):
         raise HTTPException(status_code=500, detail=f"Error searching addresses: {str(e)}")
 
 
+WILDFIRE_ZONES: Final = ('Low', 'Medium', 'High')
+
+PERMIT_TYPES: Final = (
+    'HVAC replacement', 'Kitchen remodel', 'Bathroom remodel',
+    'Electrical upgrade', 'Roof replacement', 'Window replacement',
+    'Solar installation', 'Water heater replacement'
+)
+
+PERMIT_YEARS: Final = tuple(range(2010, 2024))
+
+_MASK64 = (1 << 64) - 1
+
+
+class SplitMix64:
+    """
+    Minimal SplitMix64 generator for mock property data
+    Local per-call state avoids mutating the global random module
+    """
+    __slots__ = ("state",)
+    
+    def __init__(self, seed: int):
+        self.state = seed & _MASK64
+    
+    def next(self) -> int:
+        self.state = (self.state + 0x9E3779B97F4A7C15) & _MASK64
+        z = self.state
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+        return z ^ (z >> 31)
+    
+    def randint(self, low: int, high: int) -> int:
+        return low + self.next() % (high - low + 1)
+    
+    def choice(self, seq):
+        return seq[self.next() % len(seq)]
+    
+    def choices(self, seq, k: int) -> list:
+        n = len(seq)
+        return [seq[self.next() % n] for _ in range(k)]
+    
+    def uniform(self, low: float, high: float) -> float:
+        return low + (high - low) * ((self.next() >> 11) / 9007199254740992.0)
+
+
 def generate_mock_property_data(address: str) -> PropertyData:
     """
     Generate mock property data based on address
     Uses address hash to ensure consistent data for same address
     """
-    # Use address hash for consistent random generation
-    seed = hash(address) % (2**32)
-    random.seed(seed)
-    
-    # Extract city and county from address if possible
-    city_match = re.search(r',\s*([^,]+),\s*CA', address)
-    city = city_match.group(1).strip() if city_match else "Los Angeles"
-    
-    # Approximate coordinates for common cities (for utility lookup)
-    city_coords = {
-        "Los Angeles": (34.0522, -118.2437),
-        "Pasadena": (34.1478, -118.1445),
-        "Glendale": (34.1425, -118.2551),
-        "Burbank": (34.1808, -118.3090),
-        "Santa Monica": (34.0195, -118.4912),
-        "Irvine": (33.6846, -117.8265),
-        "San Diego": (32.7157, -117.1611),
-        "Sacramento": (38.5816, -121.4944),
-    }
+    # Use a stable address hash so every worker generates the same data
+    seed = zlib.crc32(address.encode("utf-8"))
+    rng = SplitMix64(seed)
     
-    # Get coordinates for the city or use LA as default
-    lat, lon = city_coords.get(city, (34.0522, -118.2437))
-    
-    # Determine county based on city
-    county_map = {
-        "Los Angeles": "Los Angeles County",
-        "Pasadena": "Los Angeles County",
-        "Glendale": "Los Angeles County",
-        "Burbank": "Los Angeles County",
-        "Santa Monica": "Los Angeles County",
-        "Irvine": "Orange County",
-        "San Diego": "San Diego County",
-        "Sacramento": "Sacramento County",
-    }
-    county = county_map.get(city, "Los Angeles County")
-    
-    # Use utility lookup service to detect all utilities
-    utility_lookup = UtilityLookupService()
-    utilities = utility_lookup.lookup_utilities(
-        latitude=lat,
-        longitude=lon,
-        city=city,
-        county=county,
-        state="CA"
-    )
+    # Extract city from address and detect its utilities (memoized per city)
+    city = extract_city(address)
+    providers = lookup_city_providers(city)
     
     # Extract utility provider names
-    electric_provider = utilities["electric"].name if utilities["electric"] else None
-    gas_provider = utilities["gas"].name if utilities["gas"] else None
-    water_provider = utilities["water"].name if utilities["water"] else None
+    electric_provider = providers.get("electric_provider")
+    gas_provider = providers.get("gas_provider")
+    water_provider = providers.get("water_provider")
     
     # Set legacy utilityProvider field (use electric provider as primary)
     utility_provider = electric_provider or f"{city} Utilities"
     
     # Generate property data
-    year_built = random.randint(1950, 2010)
-    square_feet = random.randint(1200, 2500)
-    bedrooms = random.randint(2, 4)
-    bathrooms = random.randint(1, 3)
-    lot_size = random.randint(4000, 8000)
-    
-    assessed_value = random.randint(500000, 900000)
-    last_sale_price = int(assessed_value * random.uniform(1.05, 1.15))
+    year_built = rng.randint(1950, 2010)
+    square_feet = rng.randint(1200, 2500)
+    bedrooms = rng.randint(2, 4)
+    bathrooms = rng.randint(1, 3)
+    lot_size = rng.randint(4000, 8000)
+    
+    assessed_value = rng.randint(500000, 900000)
+    last_sale_price = int(assessed_value * rng.uniform(1.05, 1.15))
     property_tax_estimate = int(assessed_value * 0.012)  # ~1.2% property tax rate
     
-    wildfire_zone = random.choice(['Low', 'Medium', 'High'])
-    roof_age = random.randint(5, 25)
-    solar_feasibility_score = random.randint(65, 95)
+    wildfire_zone = rng.choice(WILDFIRE_ZONES)
+    roof_age = rng.randint(5, 25)
+    solar_feasibility_score = rng.randint(65, 95)
     
     # Generate permit history
-    permit_types = [
-        'HVAC replacement', 'Kitchen remodel', 'Bathroom remodel',
-        'Electrical upgrade', 'Roof replacement', 'Window replacement',
-        'Solar installation', 'Water heater replacement'
-    ]
-    num_permits = random.randint(1, 3)
-    permit_history = [
-        f"{random.choice(permit_types)} ({random.randint(2010, 2023)})"
-        for _ in range(num_permits)
-    ]
+    num_permits = rng.randint(1, 3)
+    permit_kinds = rng.choices(PERMIT_TYPES, k=num_permits)
+    permit_years = rng.choices(PERMIT_YEARS, k=num_permits)
+    permit_history = [f"{kind} ({year})" for kind, year in zip(permit_kinds, permit_years)]
     
     return PropertyData(
         address=address,
@@ -242,7 +372,126 @@ def generate_mock_property_data(address: str) -> PropertyData:
     )
 
 
-@app.post("/api/v1/properties/lookup", response_model=PropertyLookupResponse)
+class PropertyLookup(NamedTuple):
+    """
+    Property data and opportunities, plus their alias-keyed dict forms
+    and the lookup response JSON up to the session ID
+    """
+    property_data: PropertyData
+    opportunities: Tuple[SavingsOpportunity, ...]
+    property_dict: Dict
+    opportunity_dicts: Tuple[Dict, ...]
+    response_prefix: bytes
+
+
+async def load_property(address: str) -> PropertyLookup:
+    """
+    Load property data and savings opportunities for an address
+    Upserts the generated property so the stored document wins on later lookups
+    """
+    # Generate mock property data (deterministic per address) off the event loop and
+    # upsert it, keeping any document that already exists for this address
+    generated = await asyncio.to_thread(generate_mock_property_data, address)
+    now = datetime.now(timezone.utc)
+    property_doc = {
+        "address": generated.address,
+        "year_built": generated.yearBuilt,
+        "square_feet": generated.squareFeet,
+        "bedrooms": generated.bedrooms,
+        "bathrooms": generated.bathrooms,
+        "lot_size": generated.lotSize,
+        "last_sale_price": generated.lastSalePrice,
+        "assessed_value": generated.assessedValue,
+        "property_tax_estimate": generated.propertyTaxEstimate,
+        "utility_provider": generated.utilityProvider,
+        "electric_provider": generated.electricProvider,
+        "gas_provider": generated.gasProvider,
+        "water_provider": generated.waterProvider,
+        "wildfire_zone": generated.wildfireZone,
+        "roof_age": generated.roofAge,
+        "solar_feasibility_score": generated.solarFeasibilityScore,
+        "permit_history": generated.permitHistory,
+        "created_at": now
+    }
+    
+    stored_property = await properties_collection.find_one_and_update(
+        {"address": address},
+        {"$setOnInsert": property_doc, "$set": {"updated_at": now}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+        projection={"_id": 0, "created_at": 0, "updated_at": 0}
+    )
+    
+    # Convert MongoDB document to PropertyData
+    property_data = PropertyData(
+        address=stored_property["address"],
+        yearBuilt=stored_property["year_built"],
+        squareFeet=stored_property["square_feet"],
+        bedrooms=stored_property["bedrooms"],
+        bathrooms=stored_property["bathrooms"],
+        lotSize=stored_property["lot_size"],
+        lastSalePrice=stored_property["last_sale_price"],
+        assessedValue=stored_property["assessed_value"],
+        propertyTaxEstimate=stored_property["property_tax_estimate"],
+        utilityProvider=stored_property["utility_provider"],
+        electricProvider=stored_property.get("electric_provider"),
+        gasProvider=stored_property.get("gas_provider"),
+        waterProvider=stored_property.get("water_provider"),
+        wildfireZone=stored_property["wildfire_zone"],
+        roofAge=stored_property["roof_age"],
+        solarFeasibilityScore=stored_property["solar_feasibility_score"],
+        permitHistory=stored_property["permit_history"]
+    )
+    
+    # Generate savings opportunities
+    opportunities = generate_opportunities(property_data)
+    
+    # Dump once; the dicts are shared by session documents and the JSON by responses
+    response_prefix = b"".join((
+        b'{"property":',
+        property_data.model_dump_json(by_alias=True).encode("utf-8"),
+        b',"opportunities":',
+        OpportunityListAdapter.dump_json(opportunities, by_alias=True),
+        b',"session_id":"'
+    ))
+    return PropertyLookup(
+        property_data=property_data,
+        opportunities=opportunities,
+        property_dict=property_data.model_dump(by_alias=True),
+        opportunity_dicts=OpportunityListAdapter.dump_python(opportunities, by_alias=True),
+        response_prefix=response_prefix
+    )
+
+
+async def get_property_with_opportunities(address: str) -> PropertyLookup:
+    """
+    Return cached property data and opportunities for an address
+    The cached dicts are shared between requests and must not be mutated
+    Concurrent misses for the same address share a single database round trip
+    """
+    cached = property_cache.get(address)
+    if cached is not None:
+        return cached
+    
+    lock = property_locks.setdefault(address, asyncio.Lock())
+    try:
+        async with lock:
+            cached = property_cache.get(address)
+            if cached is None:
+                cached = await load_property(address)
+                property_cache[address] = cached
+            return cached
+    finally:
+        if not lock.locked():
+            property_locks.pop(address, None)
+
+
+# The handler returns pre-serialized JSON, so the model only documents the response schema
+@app.post(
+    "/api/v1/properties/lookup",
+    response_class=Response,
+    responses={200: {"model": PropertyLookupResponse}}
+)
 async def lookup_property(request: PropertyLookupRequest):
     """
     Property lookup endpoint
@@ -251,89 +500,83 @@ async def lookup_property(request: PropertyLookupRequest):
     try:
         address = request.address
         
-        # Check if property exists in database
-        properties_collection = db.properties
-        existing_property = await properties_collection.find_one({"address": address})
-        
-        if existing_property:
-            # Convert MongoDB document to PropertyData
-            property_data = PropertyData(
-                address=existing_property["address"],
-                yearBuilt=existing_property["year_built"],
-                squareFeet=existing_property["square_feet"],
-                bedrooms=existing_property["bedrooms"],
-                bathrooms=existing_property["bathrooms"],
-                lotSize=existing_property["lot_size"],
-                lastSalePrice=existing_property["last_sale_price"],
-                assessedValue=existing_property["assessed_value"],
-                propertyTaxEstimate=existing_property["property_tax_estimate"],
-                utilityProvider=existing_property["utility_provider"],
-                electricProvider=existing_property.get("electric_provider"),
-                gasProvider=existing_property.get("gas_provider"),
-                waterProvider=existing_property.get("water_provider"),
-                wildfireZone=existing_property["wildfire_zone"],
-                roofAge=existing_property["roof_age"],
-                solarFeasibilityScore=existing_property["solar_feasibility_score"],
-                permitHistory=existing_property["permit_history"]
-            )
-        else:
-            # Generate mock property data
-            property_data = generate_mock_property_data(address)
-            
-            # Store in database
-            property_doc = {
-                "address": property_data.address,
-                "year_built": property_data.yearBuilt,
-                "square_feet": property_data.squareFeet,
-                "bedrooms": property_data.bedrooms,
-                "bathrooms": property_data.bathrooms,
-                "lot_size": property_data.lotSize,
-                "last_sale_price": property_data.lastSalePrice,
-                "assessed_value": property_data.assessedValue,
-                "property_tax_estimate": property_data.propertyTaxEstimate,
-                "utility_provider": property_data.utilityProvider,
-                "electric_provider": property_data.electricProvider,
-                "gas_provider": property_data.gasProvider,
-                "water_provider": property_data.waterProvider,
-                "wildfire_zone": property_data.wildfireZone,
-                "roof_age": property_data.roofAge,
-                "solar_feasibility_score": property_data.solarFeasibilityScore,
-                "permit_history": property_data.permitHistory,
-                "created_at": datetime.utcnow(),
-                "updated_at": datetime.utcnow()
-            }
-            await properties_collection.insert_one(property_doc)
-        
-        # Generate savings opportunities
-        opportunities = generate_opportunities(property_data)
+        lookup = await get_property_with_opportunities(address)
         
         # Create session
         session_id = str(uuid4())
         session_duration_hours = int(os.getenv("SESSION_DURATION_HOURS", "24"))
-        expires_at = datetime.utcnow() + timedelta(hours=session_duration_hours)
+        # Truncated to BSON's millisecond precision so the cached session matches the stored one
+        now = datetime.now(timezone.utc)
+        now = now.replace(microsecond=now.microsecond // 1000 * 1000)
+        expires_at = now + timedelta(hours=session_duration_hours)
         
         session_doc = {
             "session_id": session_id,
-            "property_data": property_data.model_dump(by_alias=True),
-            "opportunities": [opp.model_dump(by_alias=True) for opp in opportunities],
-            "created_at": datetime.utcnow(),
+            "property_data": lookup.property_dict,
+            "opportunities": lookup.opportunity_dicts,
+            "created_at": now,
             "expires_at": expires_at
         }
         
-        sessions_collection = db.sessions
-        await sessions_collection.insert_one(session_doc)
+        # Persist the session with an acknowledged write so the returned session_id
+        # is readable from any worker as soon as the client has it; the insert runs
+        # while the cached session and response body are built, and is awaited before returning
+        insert_task = asyncio.create_task(sessions_collection.insert_one(session_doc))
+        
+        session_data = Session.model_construct(
+            session_id=session_id,
+            property_data=lookup.property_data,
+            opportunities=list(lookup.opportunities),
+            created_at=now,
+            expires_at=expires_at
+        )
+        
+        # Reuse the precomputed JSON and append the session ID (a UUID, so no
+        # escaping needed); returning a Response skips FastAPI's re-validation
+        content = lookup.response_prefix + session_id.encode("ascii") + b'"}'
+        
+        await insert_task
         
-        # Convert to dict with aliases for JSON serialization
-        return PropertyLookupResponse(
-            property=property_data,
-            opportunities=opportunities,
-            session_id=session_id
-        ).model_dump(by_alias=True)
+        # Seed the parsed-session cache so an immediate report request skips the read
+        session_cache[session_id] = session_data
+        
+        return Response(content=content, media_type="application/json")
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error looking up property: {str(e)}")
 
 
+async def load_valid_session(session_id: str) -> Session:
+    """
+    Fetch an unexpired session and parse it into a Session model
+    Parsed sessions are cached briefly so download-then-email reuses one lookup
+    Raises a 404 HTTPException if the session is missing or expired
+    """
+    now = datetime.now(timezone.utc)
+    session_data = session_cache.get(session_id)
+    if session_data is not None and session_data.expires_at > now:
+        return session_data
+    
+    # Expired sessions are filtered out by the query even before the TTL monitor reaps them
+    session_doc = await sessions_collection.find_one(
+        {"session_id": session_id, "expires_at": {"$gt": now}},
+        {"_id": 0, "property_data": 1, "opportunities": 1, "created_at": 1, "expires_at": 1}
+    )
+    if not session_doc:
+        raise HTTPException(status_code=404, detail="Session not found or expired")
+    
+    # Session contents were validated when written, so construct without re-validating
+    session_data = Session.model_construct(
+        session_id=session_id,
+        property_data=PropertyData.model_construct(**session_doc["property_data"]),
+        opportunities=[construct_opportunity(opp) for opp in session_doc["opportunities"]],
+        created_at=session_doc["created_at"],
+        expires_at=session_doc["expires_at"]
+    )
+    session_cache[session_id] = session_data
+    return session_data
+
+
 @app.get("/api/v1/sessions/{session_id}")
 async def get_session(session_id: str):
     """
@@ -341,21 +584,13 @@ async def get_session(session_id: str):
     Returns property data and opportunities if session is valid
     """
     try:
-        sessions_collection = db.sessions
-        session = await sessions_collection.find_one({"session_id": session_id})
-        
-        if not session:
-            raise HTTPException(status_code=404, detail="Session not found")
-        
-        # Check if session expired
-        if session["expires_at"] < datetime.utcnow():
-            raise HTTPException(status_code=404, detail="Session expired")
+        session_data = await load_valid_session(session_id)
         
         # Return session data
         return {
-            "property": session["property_data"],
-            "opportunities": session["opportunities"],
-            "expires_at": session["expires_at"].isoformat() + "Z"
+            "property": session_data.property_data.model_dump(by_alias=True),
+            "opportunities": OpportunityListAdapter.dump_python(session_data.opportunities, by_alias=True),
+            "expires_at": session_data.expires_at.isoformat()
         }
     
     except HTTPException:
@@ -364,6 +599,30 @@ async def get_session(session_id: str):
         raise HTTPException(status_code=500, detail=f"Error retrieving session: {str(e)}")
 
 
+async def get_report_pdf(session_data: Session) -> bytes:
+    """
+    Return the PDF report for a session, rendering it only once per session
+    Rendered PDFs are stored in pdf_cache and expire along with the session
+    """
+    cached = await pdf_cache_collection.find_one(
+        {"session_id": session_data.session_id},
+        {"_id": 0, "pdf": 1}
+    )
+    if cached:
+        return bytes(cached["pdf"])
+    
+    # Generate PDF in the process pool so rendering doesn't block the event loop
+    loop = asyncio.get_running_loop()
+    pdf_bytes = await loop.run_in_executor(pdf_executor, generate_report_pdf, session_data)
+    
+    await pdf_cache_collection.update_one(
+        {"session_id": session_data.session_id},
+        {"$setOnInsert": {"pdf": Binary(pdf_bytes), "expires_at": session_data.expires_at}},
+        upsert=True
+    )
+    return pdf_bytes
+
+
 # Request models for report endpoints
 class PDFReportRequest(BaseModel):
     """Request model for PDF report generation"""
@@ -387,35 +646,18 @@ class WaitlistRequest(BaseModel):
 async def generate_pdf_report(request: PDFReportRequest):
     """
     PDF report generation endpoint
-    Returns a PDF file as a streaming response
+    Returns a PDF file as an attachment response
     """
     try:
         # Fetch session data
-        sessions_collection = db.sessions
-        session_doc = await sessions_collection.find_one({"session_id": request.session_id})
-        
-        if not session_doc:
-            raise HTTPException(status_code=404, detail="Session not found")
-        
-        # Check if session expired
-        if session_doc["expires_at"] < datetime.utcnow():
-            raise HTTPException(status_code=404, detail="Session expired")
-        
-        # Convert session document to Session model
-        session_data = Session(
-            session_id=session_doc["session_id"],
-            property_data=PropertyData(**session_doc["property_data"]),
-            opportunities=[SavingsOpportunity(**opp) for opp in session_doc["opportunities"]],
-            created_at=session_doc["created_at"],
-            expires_at=session_doc["expires_at"]
-        )
+        session_data = await load_valid_session(request.session_id)
         
-        # Generate PDF
-        pdf_bytes = generate_report_pdf(session_data)
+        # Generate PDF (or reuse the one already rendered for this session)
+        pdf_bytes = await get_report_pdf(session_data)
         
-        # Return as streaming response
-        return StreamingResponse(
-            BytesIO(pdf_bytes),
+        # Return the bytes directly; wrapping them in a stream only adds a copy
+        return Response(
+            content=pdf_bytes,
             media_type="application/pdf",
             headers={
                 "Content-Disposition": "attachment; filename=HOCS_Report.pdf"
@@ -428,46 +670,55 @@ async def generate_pdf_report(request: PDFReportRequest):
         raise HTTPException(status_code=500, detail=f"Error generating PDF: {str(e)}")
 
 
+async def send_report_email_in_background(
+    to_email: str,
+    pdf_bytes: bytes,
+    session_id: str,
+    opt_in: bool
+) -> None:
+    """Send a queued report email, logging failures since the response has already gone out"""
+    try:
+        await send_report_email(
+            to_email=to_email,
+            pdf_bytes=pdf_bytes,
+            session_id=session_id,
+            opt_in=opt_in,
+            db_client=mongo_client
+        )
+    except Exception as e:
+        print(f"✗ Failed to send report email for session {session_id}: {str(e)}")
+
+
 @app.post("/api/v1/reports/email")
-async def email_report(request: EmailReportRequest):
+async def email_report(request: EmailReportRequest, background_tasks: BackgroundTasks):
     """
     Email report endpoint
-    Generates PDF and sends it via email
+    Generates PDF and queues it to be sent via email after the response
     """
     try:
-        # Fetch session data
-        sessions_collection = db.sessions
-        session_doc = await sessions_collection.find_one({"session_id": request.session_id})
+        # Fail now rather than after queueing if email isn't configured
+        # (the recipient address is already validated by EmailStr)
+        ensure_email_configured()
         
-        if not session_doc:
-            raise HTTPException(status_code=404, detail="Session not found")
-        
-        # Check if session expired
-        if session_doc["expires_at"] < datetime.utcnow():
-            raise HTTPException(status_code=404, detail="Session expired")
-        
-        # Convert session document to Session model
-        session_data = Session(
-            session_id=session_doc["session_id"],
-            property_data=PropertyData(**session_doc["property_data"]),
-            opportunities=[SavingsOpportunity(**opp) for opp in session_doc["opportunities"]],
-            created_at=session_doc["created_at"],
-            expires_at=session_doc["expires_at"]
-        )
+        # Fetch session data
+        session_data = await load_valid_session(request.session_id)
         
-        # Generate PDF
-        pdf_bytes = generate_report_pdf(session_data)
+        # Generate PDF (or reuse the one already rendered for this session)
+        pdf_bytes = await get_report_pdf(session_data)
         
-        # Send email
-        result = await send_report_email(
+        # Send email in the background so the client doesn't wait on Resend
+        background_tasks.add_task(
+            send_report_email_in_background,
             to_email=request.email,
             pdf_bytes=pdf_bytes,
             session_id=request.session_id,
-            opt_in=request.opt_in_updates,
-            db_client=mongo_client
+            opt_in=request.opt_in_updates
         )
         
-        return result
+        return {
+            'status': 'queued',
+            'message': f'Report will be sent to {request.email}'
+        }
     
     except HTTPException:
         raise
@@ -492,7 +743,6 @@ async def lookup_utilities(request: UtilityLookupRequest):
     """
     try:
         # Initialize services
-        utility_lookup = UtilityLookupService()
         program_service = UtilityProgramService()
         
         # Look up utilities for the address
@@ -507,18 +757,14 @@ async def lookup_utilities(request: UtilityLookupRequest):
         # Get utility information
         utility_info = utility_lookup.get_utility_info(utilities)
         
-        # Get programs for each utility
-        programs = program_service.get_all_programs_for_address(utilities)
-        
-        # Format programs for API response
-        formatted_programs = {}
-        for utility_type, program_list in programs.items():
-            formatted_programs[utility_type] = program_service.format_programs_for_api(program_list)
+        # Program arrays are pre-serialized per utility, so only the small utilities block is encoded per request
+        programs_json = program_service.format_all_programs_for_api_json(utilities)
+        utilities_json = json.dumps(utility_info, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
         
-        return {
-            "utilities": utility_info,
-            "programs": formatted_programs
-        }
+        return Response(
+            content=b'{"utilities":' + utilities_json + b',"programs":' + programs_json + b'}',
+            media_type="application/json"
+        )
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error looking up utilities: {str(e)}")
@@ -531,31 +777,27 @@ async def add_to_waitlist(request: WaitlistRequest):
     Saves email and address for future notification
     """
     try:
-        waitlist_collection = db.waitlist
-        
-        # Check if email already exists for this address
-        existing = await waitlist_collection.find_one({
-            "email": request.email,
-            "address": request.address
-        })
+        # Upsert keyed on (email, address); the unique index rejects concurrent duplicates
+        try:
+            result = await waitlist_collection.update_one(
+                {"email": request.email, "address": request.address},
+                {"$setOnInsert": {
+                    "source": "unsupported_area",
+                    "created_at": datetime.now(timezone.utc),
+                    "notified": False
+                }},
+                upsert=True
+            )
+            already_registered = result.upserted_id is None
+        except DuplicateKeyError:
+            already_registered = True
         
-        if existing:
+        if already_registered:
             return {
                 "message": "You're already on the waitlist for this address",
                 "already_registered": True
             }
         
-        # Add to waitlist
-        waitlist_doc = {
-            "email": request.email,
-            "address": request.address,
-            "source": "unsupported_area",
-            "created_at": datetime.utcnow(),
-            "notified": False
-        }
-        
-        await waitlist_collection.insert_one(waitlist_doc)
-        
         return {
             "message": "Successfully added to waitlist",
             "already_registered": False
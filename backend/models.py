@@ -1,7 +1,7 @@
-from pydantic import BaseModel, Field
-from typing import List, Literal, Optional
-from datetime import datetime
-from uuid import UUID, uuid4
+from pydantic import BaseModel, Field, TypeAdapter
+from typing import List, Literal, Optional, Sequence
+from datetime import datetime, timezone
+from uuid import uuid4
 
 
 class OfficialResource(BaseModel):
@@ -10,6 +10,9 @@ class OfficialResource(BaseModel):
     url: str
     type: Literal['government', 'utility', 'program']
 
+    class Config:
+        frozen = True
+
 
 class Rebate(BaseModel):
     """Rebate information for savings opportunities"""
@@ -17,12 +20,18 @@ class Rebate(BaseModel):
     amount: float
     link: str
 
+    class Config:
+        frozen = True
+
 
 class UpfrontCost(BaseModel):
     """Upfront cost range for savings opportunities"""
     min: float
     max: float
 
+    class Config:
+        frozen = True
+
 
 class SavingsOpportunity(BaseModel):
     """Savings opportunity model matching TypeScript interface"""
@@ -42,6 +51,28 @@ class SavingsOpportunity(BaseModel):
 
     class Config:
         populate_by_name = True
+        frozen = True  # Opportunity templates are shared between requests
+
+
+# Shared adapter for dumping/validating opportunity lists in one pass; accepts lists or tuples
+OpportunityListAdapter = TypeAdapter(Sequence[SavingsOpportunity])
+
+
+def construct_opportunity(data: dict) -> SavingsOpportunity:
+    """
+    Build a SavingsOpportunity from already-validated stored data without re-validating.
+    Nested models are constructed explicitly since model_construct does not recurse.
+    """
+    resources = data.get('officialResources')
+    return SavingsOpportunity.model_construct(**{
+        **data,
+        'upfrontCost': UpfrontCost.model_construct(**data['upfrontCost']),
+        'rebates': [Rebate.model_construct(**rebate) for rebate in data['rebates']],
+        'officialResources': (
+            [OfficialResource.model_construct(**resource) for resource in resources]
+            if resources is not None else None
+        ),
+    })
 
 
 class PropertyData(BaseModel):
@@ -79,7 +110,7 @@ class Session(BaseModel):
     session_id: str = Field(default_factory=lambda: str(uuid4()), alias='session_id')
     property_data: PropertyData = Field(alias='property_data')
     opportunities: List[SavingsOpportunity]
-    created_at: datetime = Field(default_factory=datetime.utcnow, alias='created_at')
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), alias='created_at')
     expires_at: datetime = Field(alias='expires_at')
 
     class Config:
@@ -7,6 +7,8 @@ from motor.motor_asyncio import AsyncIOMotorClient
 import os
 from dotenv import load_dotenv
 
+from services.address_service import enrich_address
+
 # Load environment variables
 load_dotenv()
 
@@ -34,7 +36,11 @@ async def seed_addresses():
         print(f"Cleared {result.deleted_count} existing addresses")
         
         # Insert LA County addresses
-        address_documents = [{"address": addr} for addr in LA_COUNTY_ADDRESSES]
+        # Store the lowercased address for anchored prefix autocomplete
+        address_documents = [
+            {"address": addr, **enrich_address(addr)}
+            for addr in LA_COUNTY_ADDRESSES
+        ]
         result = await addresses_collection.insert_many(address_documents)
         print(f"Successfully inserted {len(result.inserted_ids)} addresses:")
         
@@ -45,6 +51,10 @@ async def seed_addresses():
         await addresses_collection.create_index([("address", "text")])
         print("\nCreated text index on 'address' field for efficient searching")
         
+        # Create prefix index for anchored autocomplete lookups
+        await addresses_collection.create_index("address_lc")
+        print("Created index on 'address_lc' field for prefix autocomplete")
+        
         # Verify the data
         count = await addresses_collection.count_documents({})
         print(f"\nTotal addresses in collection: {count}")
@@ -0,0 +1,81 @@
+"""
+Address helpers shared by the API and the address maintenance scripts.
+Derives the city and utility providers for a California address.
+"""
+import re
+from functools import lru_cache
+from typing import Dict, Final, Mapping, Optional, Tuple
+
+from services.utility_lookup_service import UtilityLookupService
+
+# Extracts the city from "<street>, <city>, CA <zip>" addresses
+CITY_PATTERN = re.compile(r',\s*([^,]+),\s*CA')
+
+# Approximate coordinates for common cities (for utility lookup)
+CITY_COORDS: Final[Mapping[str, Tuple[float, float]]] = {
+    "Los Angeles": (34.0522, -118.2437),
+    "Pasadena": (34.1478, -118.1445),
+    "Glendale": (34.1425, -118.2551),
+    "Burbank": (34.1808, -118.3090),
+    "Santa Monica": (34.0195, -118.4912),
+    "Irvine": (33.6846, -117.8265),
+    "San Diego": (32.7157, -117.1611),
+    "Sacramento": (38.5816, -121.4944),
+}
+
+# County for each known city
+CITY_COUNTIES: Final[Mapping[str, str]] = {
+    "Los Angeles": "Los Angeles County",
+    "Pasadena": "Los Angeles County",
+    "Glendale": "Los Angeles County",
+    "Burbank": "Los Angeles County",
+    "Santa Monica": "Los Angeles County",
+    "Irvine": "Orange County",
+    "San Diego": "San Diego County",
+    "Sacramento": "Sacramento County",
+}
+
+# Shared lookup service; it holds no per-request state
+utility_lookup = UtilityLookupService()
+
+
+def extract_city(address: str) -> str:
+    """Extract the city from an address, defaulting to Los Angeles"""
+    city_match = CITY_PATTERN.search(address)
+    return city_match.group(1).strip() if city_match else "Los Angeles"
+
+
+@lru_cache(maxsize=256)
+def lookup_city_providers(city: str) -> Dict[str, Optional[str]]:
+    """
+    Look up electric, gas, and water provider names for a city
+    Results are memoized since they depend only on the city; treat them as read-only
+    """
+    # Get coordinates for the city or use LA as default
+    lat, lon = CITY_COORDS.get(city, (34.0522, -118.2437))
+
+    # Determine county based on city
+    county = CITY_COUNTIES.get(city, "Los Angeles County")
+
+    # Use utility lookup service to detect all utilities
+    utilities = utility_lookup.lookup_utilities(
+        latitude=lat,
+        longitude=lon,
+        city=city,
+        county=county,
+        state="CA"
+    )
+
+    return {
+        "electric_provider": utilities["electric"].name if utilities["electric"] else None,
+        "gas_provider": utilities["gas"].name if utilities["gas"] else None,
+        "water_provider": utilities["water"].name if utilities["water"] else None
+    }
+
+
+def enrich_address(address: str) -> Dict:
+    """
+    Build the derived fields stored alongside an address document
+    Only the lowercased address is stored; city and providers are derived per lookup
+    """
+    return {"address_lc": address.lower()}
@@ -1,44 +1,17 @@
 """Email service for sending HOCS reports using Resend"""
 import os
+import time
+import asyncio
 import base64
-import resend
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from motor.motor_asyncio import AsyncIOMotorClient
-from typing import Optional
+from pymongo import UpdateOne, WriteConcern
+from typing import Any, List, Optional, Set, Tuple
 
 
-async def send_report_email(
-    to_email: str,
-    pdf_bytes: bytes,
-    session_id: str,
-    opt_in: bool,
-    db_client: Optional[AsyncIOMotorClient] = None
-) -> dict:
-    """
-    Send a report email with PDF attachment using Resend.
-    
-    Args:
-        to_email: Recipient email address
-        pdf_bytes: PDF file content as bytes
-        session_id: Session ID for tracking
-        opt_in: Whether user opted in for updates
-        db_client: MongoDB client for storing subscriptions
-        
-    Returns:
-        dict with status and message
-    """
-    # Get Resend API key from environment
-    resend_api_key = os.getenv('RESEND_API_KEY')
-    from_email = os.getenv('FROM_EMAIL', 'onboarding@resend.dev')
-    
-    if not resend_api_key:
-        raise ValueError("RESEND_API_KEY not configured. Please set it in environment variables.")
-    
-    # Initialize Resend
-    resend.api_key = resend_api_key
-    
-    # Email body HTML
-    email_body = f"""
+# Report email HTML, split around the opt-in notice so only the footer is formatted per send
+_BODY_HEAD = """
     <html>
     <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
         <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
@@ -66,7 +39,16 @@ async def send_report_email(
                 <li><strong>Use your data:</strong> Let actual usage inform your decisions</li>
             </ul>
             
-            {"<p><strong>You're subscribed!</strong> We'll notify you when new programs and opportunities become available in your area.</p>" if opt_in else ""}
+            """
+
+_OPT_IN_NOTICE = "<p><strong>You're subscribed!</strong> We'll notify you when new programs and opportunities become available in your area.</p>"
+
+_BODY_PREFIXES = {
+    True: _BODY_HEAD + _OPT_IN_NOTICE,
+    False: _BODY_HEAD
+}
+
+_BODY_TAIL = """
             
             <p>Questions? Reply to this email and we'll be happy to help.</p>
             
@@ -79,57 +61,187 @@ async def send_report_email(
             
             <p style="font-size: 12px; color: #666;">
                 Session ID: {session_id}<br>
-                Generated: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}
+                Generated: {generated}
             </p>
         </div>
     </body>
     </html>
     """
+
+# Last rendered "Generated" footer timestamp and when it was taken (monotonic seconds)
+_generated_at = (float('-inf'), '')
+
+
+def _generated_timestamp() -> str:
+    """Format the footer timestamp, reusing the last value for up to a second"""
+    global _generated_at
+    now = time.monotonic()
+    if now - _generated_at[0] >= 1.0:
+        _generated_at = (now, datetime.now().strftime('%B %d, %Y at %I:%M %p'))
+    return _generated_at[1]
+
+
+# Outstanding fire-and-forget subscription writes, awaited on shutdown
+_pending_writes: Set[asyncio.Task] = set()
+
+
+def _on_write_done(task: asyncio.Task) -> None:
+    """Drop a finished subscription write and log its failure"""
+    _pending_writes.discard(task)
+    if not task.cancelled() and task.exception():
+        print(f"✗ Failed to store subscriptions: {str(task.exception())}")
+
+
+async def wait_for_pending_writes() -> None:
+    """Wait for queued subscription writes to reach the server"""
+    if _pending_writes:
+        await asyncio.gather(*_pending_writes, return_exceptions=True)
+
+
+@lru_cache(maxsize=1)
+def _configure_resend() -> Tuple[Any, str]:
+    """
+    Import and configure the Resend SDK on first use, returning its Emails API and the sender address.
+    The SDK (and its HTTP stack) is only loaded by workers that actually send email.
+    Failures are not cached, so a key set after startup is picked up on the next send.
+    """
+    resend_api_key = os.getenv('RESEND_API_KEY')
     
-    # Encode PDF as base64 for Resend
-    pdf_base64 = base64.b64encode(pdf_bytes).decode('utf-8')
+    if not resend_api_key:
+        raise ValueError("RESEND_API_KEY not configured. Please set it in environment variables.")
+    
+    # Initialize Resend; the SDK reuses this key for every request
+    import resend
+    resend.api_key = resend_api_key
     
-    # Send email using Resend
+    return resend.Emails, os.getenv('FROM_EMAIL', 'onboarding@resend.dev')
+
+
+def ensure_email_configured() -> None:
+    """Raise ValueError if Resend is not configured, so callers can fail before queueing a send"""
+    _configure_resend()
+
+
+def encode_attachment(pdf_bytes: bytes) -> str:
+    """Encode PDF bytes as base64 for a Resend attachment"""
+    return base64.b64encode(pdf_bytes).decode('utf-8')
+
+
+async def send_report_email(
+    to_email: str,
+    pdf_bytes: bytes,
+    session_id: str,
+    opt_in: bool,
+    db_client: Optional[AsyncIOMotorClient] = None
+) -> dict:
+    """
+    Send a report email with PDF attachment using Resend.
+    
+    Args:
+        to_email: Recipient email address
+        pdf_bytes: PDF file content as bytes
+        session_id: Session ID for tracking
+        opt_in: Whether user opted in for updates
+        db_client: MongoDB client for storing subscriptions
+        
+    Returns:
+        dict with status and message
+    """
+    result = await send_report_emails([to_email], pdf_bytes, session_id, opt_in, db_client)
+    
+    return {
+        'status': result['status'],
+        'message': result['message'],
+        'email_id': result['email_ids'][0]
+    }
+
+
+async def send_report_emails(
+    to_emails: List[str],
+    pdf_bytes: bytes,
+    session_id: str,
+    opt_in: bool,
+    db_client: Optional[AsyncIOMotorClient] = None
+) -> dict:
+    """
+    Send the same report to several recipients, one email each.
+    The body and attachment are built once and the sends run concurrently.
+    
+    Args:
+        to_emails: Recipient email addresses
+        pdf_bytes: PDF file content as bytes
+        session_id: Session ID for tracking
+        opt_in: Whether the recipients opted in for updates
+        db_client: MongoDB client for storing subscriptions
+        
+    Returns:
+        dict with status, message, and the Resend email IDs in recipient order
+    """
+    # Resend is configured from the environment on first use
+    resend_emails, from_email = _configure_resend()
+    
+    # Email body HTML
+    email_body = _BODY_PREFIXES[opt_in] + _BODY_TAIL.format(
+        session_id=session_id,
+        generated=_generated_timestamp()
+    )
+    
+    # Encode PDF once; every recipient's attachment shares the same string
+    pdf_base64 = encode_attachment(pdf_bytes)
+    
+    # Send emails using Resend; the batch endpoint does not accept attachments,
+    # so each recipient gets its own request, run in parallel off the event loop
     try:
-        params = {
-            "from": from_email,
-            "to": [to_email],
-            "subject": "Your HOCS Visibility-First Action Plan",
-            "html": email_body,
-            "attachments": [
-                {
-                    "filename": "HOCS_Action_Plan.pdf",
-                    "content": pdf_base64
-                }
-            ]
-        }
+        attachments = [
+            {
+                "filename": "HOCS_Action_Plan.pdf",
+                "content": pdf_base64
+            }
+        ]
         
-        email_response = resend.Emails.send(params)
+        email_responses = await asyncio.gather(*(
+            asyncio.to_thread(resend_emails.send, {
+                "from": from_email,
+                "to": [to_email],
+                "subject": "Your HOCS Visibility-First Action Plan",
+                "html": email_body,
+                "attachments": attachments
+            })
+            for to_email in to_emails
+        ))
         
-        # Store subscription if opted in
+        # Store subscriptions if opted in; the write is unacknowledged and runs
+        # in the background since the emails have already gone out
         if opt_in and db_client:
             db = db_client.hocs
-            subscriptions_collection = db.email_subscriptions
+            subscriptions_collection = db.get_collection(
+                'email_subscriptions',
+                write_concern=WriteConcern(w=0)
+            )
             
-            subscription_doc = {
-                'email': to_email,
-                'session_id': session_id,
-                'subscribed_at': datetime.utcnow(),
-                'active': True
-            }
+            subscribed_at = datetime.now(timezone.utc)
             
-            # Upsert to avoid duplicates
-            await subscriptions_collection.update_one(
-                {'email': to_email},
-                {'$set': subscription_doc},
-                upsert=True
-            )
+            # Upsert to avoid duplicates, in one round trip for all recipients;
+            # existing subscriptions keep their original subscribed_at
+            task = asyncio.create_task(subscriptions_collection.bulk_write([
+                UpdateOne(
+                    {'email': to_email},
+                    {
+                        '$setOnInsert': {'subscribed_at': subscribed_at},
+                        '$set': {'session_id': session_id, 'active': True}
+                    },
+                    upsert=True
+                )
+                for to_email in dict.fromkeys(to_emails)
+            ], ordered=False))
+            _pending_writes.add(task)
+            task.add_done_callback(_on_write_done)
         
         return {
             'status': 'success',
-            'message': f'Report sent successfully to {to_email}',
-            'email_id': email_response.get('id')
+            'message': f'Report sent successfully to {", ".join(to_emails)}',
+            'email_ids': [email_response.get('id') for email_response in email_responses]
         }
         
     except Exception as e:
-        raise Exception(f"Failed to send email via Resend: {str(e)}")
\ No newline at end of file
+        raise Exception(f"Failed to send email via Resend: {str(e)}")
@@ -1,207 +1,350 @@
 """PDF generation service for HOCS reports"""
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle, Image
-from reportlab.lib import colors
-from reportlab.graphics.shapes import Drawing, Rect, String
-from reportlab.graphics import renderPDF
+import math
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
 from io import BytesIO
+from functools import lru_cache
 from datetime import datetime
-from typing import List
+from types import SimpleNamespace
+from typing import BinaryIO, List, Optional, Sequence
 from models import Session, SavingsOpportunity
 
 
-class TierGroup:
-    """Represents a tier group with opportunities"""
-    def __init__(self, tier: int, title: str, description: str, opportunities: List[SavingsOpportunity], color: str):
-        self.tier = tier
-        self.title = title
-        self.description = description
-        self.opportunities = opportunities
-        self.color = color
+# Tier number, title, description, and color for the 5-tier plan (from Plan.tsx)
+_TIER_TEMPLATES = (
+    (
+        1,
+        'Instant Visibility (Near-Zero Cost)',
+        'Set up tracking and establish your baseline. You can\'t manage what you don\'t measure.',
+        'green'
+    ),
+    (
+        2,
+        'Free In-Home Checks & Diagnostics',
+        'Get professional assessments and qualify for free upgrades at no cost.',
+        'blue'
+    ),
+    (
+        3,
+        'Data-Driven Behavior & Low-Cost Controls',
+        'Use your baseline data to make smart, low-cost changes with immediate impact.',
+        'yellow'
+    ),
+    (
+        4,
+        'Targeted Low/Medium-Cost Upgrades',
+        'Invest in upgrades that your data shows will have the best ROI.',
+        'orange'
+    ),
+    (
+        5,
+        'Major Projects Informed by Data',
+        'After 3-6 months of tracking, consider major investments with proven payback.',
+        'purple'
+    ),
+)
 
 
-def organize_opportunities_into_tiers(opportunities: List[SavingsOpportunity]) -> List[TierGroup]:
+# Static report copy
+_INTRO_TEXT = """
+    Follow this crawl-walk-run approach: Start with Tier 1 to establish visibility, 
+    then work through each tier sequentially. Complete one tier before moving to the next.
     """
-    Organize opportunities into 5 tiers based on the logic from Plan.tsx (lines 36-77)
+
+_PRINCIPLES_TEXT = """
+    • <b>Complete Tier 1 first:</b> Establish your baseline before making any changes<br/>
+    • <b>Track everything:</b> Document the date of each change and compare monthly bills<br/>
+    • <b>Wait 3-6 months:</b> Before major investments (Tier 5), verify your usage patterns with data<br/>
+    • <b>Start with free programs:</b> Maximize no-cost opportunities before spending money<br/>
+    • <b>Use your data:</b> Let actual usage inform which upgrades make sense for your home
     """
-    tier1: List[SavingsOpportunity] = []  # Instant visibility (free tracking)
-    tier2: List[SavingsOpportunity] = []  # Free diagnostics and assistance
-    tier3: List[SavingsOpportunity] = []  # Low-cost behavior changes
-    tier4: List[SavingsOpportunity] = []  # Medium-cost upgrades
-    tier5: List[SavingsOpportunity] = []  # Major projects
 
-    for opp in opportunities:
-        # Tier 2: Free programs and audits
-        if opp.upfrontCost.max == 0 and (
-            'audit' in opp.name.lower() or
-            'weatherization' in opp.name.lower() or
-            'assistance' in opp.name.lower()
-        ):
-            tier2.append(opp)
-        # Tier 3: Free or very low cost behavior changes
-        elif opp.upfrontCost.max <= 200 and (
-            'water conservation kit' in opp.name.lower() or
-            'led' in opp.name.lower() or
-            'power strip' in opp.name.lower()
-        ):
-            tier3.append(opp)
-        # Tier 4: Low to medium cost upgrades
-        elif opp.upfrontCost.max > 200 and opp.upfrontCost.max <= 3000:
-            tier4.append(opp)
-        # Tier 5: Major investments
-        elif opp.upfrontCost.max > 3000:
-            tier5.append(opp)
-        # Default: put remaining free items in tier 2
-        elif opp.upfrontCost.max == 0:
-            tier2.append(opp)
-        # Everything else goes to tier 4
-        else:
-            tier4.append(opp)
+# Portal instructions and resources-table row (name, phone, website) per known utility
+_UTILITY_INFO = {
+    "LADWP": (
+        "• LADWP account: ladwp.com (electricity & water)<br/>",
+        ('LADWP', '(800) 342-5397', 'ladwp.com')
+    ),
+    "Pasadena Water & Power": (
+        "• Pasadena Water & Power: cityofpasadena.net/water-and-power<br/>",
+        ('Pasadena Water & Power', '(626) 744-4005', 'cityofpasadena.net/water-and-power')
+    ),
+    "Glendale Water & Power": (
+        "• Glendale Water & Power: glendaleca.gov/water-power<br/>",
+        ('Glendale Water & Power', '(818) 548-2000', 'glendaleca.gov/water-power')
+    ),
+    "Burbank Water & Power": (
+        "• Burbank Water & Power: burbankwaterandpower.com<br/>",
+        ('Burbank Water & Power', '(818) 238-3700', 'burbankwaterandpower.com')
+    ),
+}
 
-    return [
-        TierGroup(
-            tier=1,
-            title='Instant Visibility (Near-Zero Cost)',
-            description='Set up tracking and establish your baseline. You can\'t manage what you don\'t measure.',
-            opportunities=tier1,
-            color='green'
+@lru_cache(maxsize=1)
+def _rl() -> SimpleNamespace:
+    """
+    Import reportlab and build the shared report styles on first use.
+    Processes that never render a report skip the import and stylesheet cost;
+    paragraph and table styles are read-only during a build, so one set serves every report.
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle
+    
+    styles = getSampleStyleSheet()
+    
+    return SimpleNamespace(
+        SimpleDocTemplate=SimpleDocTemplate,
+        Paragraph=Paragraph,
+        Spacer=Spacer,
+        PageBreak=PageBreak,
+        Table=Table,
+        letter=letter,
+        inch=inch,
+        
+        TITLE_STYLE=ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=24,
+            textColor=colors.HexColor('#1e40af'),
+            spaceAfter=12,
+            alignment=TA_CENTER
         ),
-        TierGroup(
-            tier=2,
-            title='Free In-Home Checks & Diagnostics',
-            description='Get professional assessments and qualify for free upgrades at no cost.',
-            opportunities=tier2,
-            color='blue'
+        
+        HEADING_STYLE=ParagraphStyle(
+            'CustomHeading',
+            parent=styles['Heading2'],
+            fontSize=16,
+            textColor=colors.HexColor('#1f2937'),
+            spaceAfter=10,
+            spaceBefore=10
         ),
-        TierGroup(
-            tier=3,
-            title='Data-Driven Behavior & Low-Cost Controls',
-            description='Use your baseline data to make smart, low-cost changes with immediate impact.',
-            opportunities=tier3,
-            color='yellow'
+        
+        TIER_TITLE_STYLE=ParagraphStyle(
+            'TierTitle',
+            parent=styles['Heading2'],
+            fontSize=14,
+            textColor=colors.HexColor('#1f2937'),
+            spaceAfter=6,
+            spaceBefore=12,
+            leftIndent=0
         ),
-        TierGroup(
-            tier=4,
-            title='Targeted Low/Medium-Cost Upgrades',
-            description='Invest in upgrades that your data shows will have the best ROI.',
-            opportunities=tier4,
-            color='orange'
+        
+        BODY_STYLE=ParagraphStyle(
+            'CustomBody',
+            parent=styles['Normal'],
+            fontSize=10,
+            textColor=colors.HexColor('#374151'),
+            spaceAfter=6
         ),
-        TierGroup(
-            tier=5,
-            title='Major Projects Informed by Data',
-            description='After 3-6 months of tracking, consider major investments with proven payback.',
-            opportunities=tier5,
-            color='purple'
-        )
-    ]
+        
+        SMALL_STYLE=ParagraphStyle(
+            'SmallText',
+            parent=styles['Normal'],
+            fontSize=9,
+            textColor=colors.HexColor('#6b7280'),
+            spaceAfter=4
+        ),
+        
+        SUBTITLE_STYLE=ParagraphStyle(
+            'Subtitle',
+            parent=styles['Normal'],
+            fontSize=12,
+            textColor=colors.HexColor('#4b5563'),
+            alignment=TA_CENTER,
+            spaceAfter=8
+        ),
+        
+        FOOTER_STYLE=ParagraphStyle(
+            'Footer',
+            parent=styles['Normal'],
+            fontSize=8,
+            textColor=colors.HexColor('#6b7280'),
+            alignment=TA_CENTER
+        ),
+        
+        PROPERTY_COL_WIDTHS=(2.5*inch, 3.5*inch),
+        RESOURCES_COL_WIDTHS=(2.5*inch, 1.5*inch, 2.5*inch),
+        
+        PROPERTY_TABLE_STYLE=TableStyle([
+            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f3f4f6')),
+            ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#1f2937')),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#d1d5db'))
+        ]),
+        
+        RESOURCES_TABLE_STYLE=TableStyle([
+            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#f9fafb')),
+            ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#1f2937')),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),  # Make first column bold
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#d1d5db')),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ]),
+    )
+
+
+# Name keywords for free programs (tier 2) and low-cost controls (tier 3)
+_TIER2_KEYWORDS = ('audit', 'weatherization', 'assistance')
+_TIER3_KEYWORDS = ('water conservation kit', 'led', 'power strip')
+
+
+@lru_cache(maxsize=128)
+def _classify_tier(name: str, max_cost: float) -> int:
+    """
+    Pick the tier (1-5) for an opportunity from its name and maximum upfront cost,
+    following the tier logic from Plan.tsx (lines 36-77)
+    Memoized since the opportunity catalog is small and fixed
+    """
+    name_lc = name.lower()
+    # Tier 2: Free programs and audits
+    if max_cost == 0 and any(keyword in name_lc for keyword in _TIER2_KEYWORDS):
+        return 2
+    # Tier 3: Free or very low cost behavior changes
+    if max_cost <= 200 and any(keyword in name_lc for keyword in _TIER3_KEYWORDS):
+        return 3
+    # Tier 4: Low to medium cost upgrades
+    if 200 < max_cost <= 3000:
+        return 4
+    # Tier 5: Major investments
+    if max_cost > 3000:
+        return 5
+    # Default: put remaining free items in tier 2
+    if max_cost == 0:
+        return 2
+    # Everything else goes to tier 4
+    return 4
 
 
+@lru_cache(maxsize=4096)
 def format_currency(value: float) -> str:
-    """Format currency values"""
+    """Format currency values (memoized; catalog amounts repeat across reports)"""
     return f"${value:,.0f}"
 
 
+@lru_cache(maxsize=1024)
+def _currency_range(min_value: float, max_value: float) -> str:
+    """Format a cost range like $900–$2,200 (memoized)"""
+    return f"{format_currency(min_value)}–{format_currency(max_value)}"
+
+
+def _render_opportunities_by_tier(opportunities: Sequence[SavingsOpportunity]) -> List[list]:
+    """
+    Classify each opportunity and render its flowables in the same pass,
+    returning the rendered elements for each of the 5 tiers in report order
+    """
+    rl = _rl()
+    tier_elements: List[list] = [[], [], [], [], []]
+
+    for opp in opportunities:
+        is_free = opp.upfrontCost.max == 0
+        elements = tier_elements[_classify_tier(opp.name, opp.upfrontCost.max) - 1]
+
+        # Opportunity name and savings
+        opp_title = f"<b>{opp.name}</b>{' [FREE]' if is_free else ''} - Annual Savings: {format_currency(opp.annualSavings)}"
+        elements.append(rl.Paragraph(opp_title, rl.BODY_STYLE))
+
+        # Cost and difficulty
+        if is_free:
+            cost_range = "$0"
+        else:
+            cost_range = _currency_range(opp.upfrontCost.min, opp.upfrontCost.max)
+        elements.append(rl.Paragraph(f"Your Cost: {cost_range} | Effort: {opp.difficulty}", rl.SMALL_STYLE))
+
+        # Benefits
+        if opp.benefits:
+            elements.append(rl.Paragraph(f"<i>{opp.benefits[0]}</i>", rl.SMALL_STYLE))
+
+        # Next steps
+        if opp.nextSteps:
+            next_steps_text = "<b>Next Steps:</b><br/>" + "".join(
+                f"{i}. {step}<br/>" for i, step in enumerate(opp.nextSteps[:2], 1)
+            )
+            elements.append(rl.Paragraph(next_steps_text, rl.SMALL_STYLE))
+
+        elements.append(rl.Spacer(1, 0.15*rl.inch))
+
+    return tier_elements
+
+
 def generate_report_pdf(session_data: Session) -> bytes:
     """
     Generate a PDF report for a session with property data and opportunities.
     Implements the 5-tier action plan structure from Plan.tsx.
     """
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=0.5*inch, bottomMargin=0.5*inch)
-    
-    # Container for the 'Flowable' objects
-    elements = []
-    
-    # Define styles
-    styles = getSampleStyleSheet()
-    
-    # Custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        textColor=colors.HexColor('#1e40af'),
-        spaceAfter=12,
-        alignment=TA_CENTER
-    )
-    
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=16,
-        textColor=colors.HexColor('#1f2937'),
-        spaceAfter=10,
-        spaceBefore=10
-    )
-    
-    tier_title_style = ParagraphStyle(
-        'TierTitle',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=colors.HexColor('#1f2937'),
-        spaceAfter=6,
-        spaceBefore=12,
-        leftIndent=0
-    )
+    with BytesIO() as buffer:
+        generate_report_pdf_to_stream(session_data, buffer)
+        return buffer.getvalue()
+
+
+def generate_report_pdfs(sessions: Sequence[Session], executor: Optional[Executor] = None) -> List[bytes]:
+    """
+    Generate PDF reports for many sessions in parallel, one worker process per core.
+    Pass an existing process pool to reuse it; otherwise a temporary one is created.
+    """
+    if executor is not None:
+        return list(executor.map(generate_report_pdf, sessions, chunksize=4))
     
-    body_style = ParagraphStyle(
-        'CustomBody',
-        parent=styles['Normal'],
-        fontSize=10,
-        textColor=colors.HexColor('#374151'),
-        spaceAfter=6
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        return list(pool.map(generate_report_pdf, sessions, chunksize=4))
+
+
+def generate_report_pdf_to_stream(session_data: Session, out_stream: BinaryIO) -> None:
+    """
+    Write the PDF report for a session directly to a binary file-like object.
+    """
+    rl = _rl()
+    
+    # Page compression roughly halves the file size for ~15% more build time;
+    # set PDF_PAGE_COMPRESSION=0 where latency matters more than size
+    doc = rl.SimpleDocTemplate(
+        out_stream,
+        pagesize=rl.letter,
+        topMargin=0.5*rl.inch,
+        bottomMargin=0.5*rl.inch,
+        pageCompression=os.getenv("PDF_PAGE_COMPRESSION", "1") != "0"
     )
     
-    small_style = ParagraphStyle(
-        'SmallText',
-        parent=styles['Normal'],
-        fontSize=9,
-        textColor=colors.HexColor('#6b7280'),
-        spaceAfter=4
-    )
+    # Container for the 'Flowable' objects
+    elements = []
     
-    subtitle_style = ParagraphStyle(
-        'Subtitle',
-        parent=styles['Normal'],
-        fontSize=12,
-        textColor=colors.HexColor('#4b5563'),
-        alignment=TA_CENTER,
-        spaceAfter=8
-    )
+    # Formatted once so the cover and footer always show the same date
+    generated_date = datetime.now().strftime('%B %d, %Y')
     
     # Cover Page
-    elements.append(Spacer(1, 1.5*inch))
-    elements.append(Paragraph("HOCS", title_style))
-    elements.append(Paragraph("Home Ownership Cost Savings", subtitle_style))
-    elements.append(Spacer(1, 0.3*inch))
-    elements.append(Paragraph("Your Visibility-First Action Plan", heading_style))
-    elements.append(Spacer(1, 0.2*inch))
-    elements.append(Paragraph(f"<b>Property:</b> {session_data.property_data.address}", body_style))
-    elements.append(Paragraph(f"<b>Generated:</b> {datetime.now().strftime('%B %d, %Y')}", body_style))
-    elements.append(Spacer(1, 0.3*inch))
+    elements.append(rl.Spacer(1, 1.5*rl.inch))
+    elements.append(rl.Paragraph("HOCS", rl.TITLE_STYLE))
+    elements.append(rl.Paragraph("Home Ownership Cost Savings", rl.SUBTITLE_STYLE))
+    elements.append(rl.Spacer(1, 0.3*rl.inch))
+    elements.append(rl.Paragraph("Your Visibility-First Action Plan", rl.HEADING_STYLE))
+    elements.append(rl.Spacer(1, 0.2*rl.inch))
+    elements.append(rl.Paragraph(f"<b>Property:</b> {session_data.property_data.address}", rl.BODY_STYLE))
+    elements.append(rl.Paragraph(f"<b>Generated:</b> {generated_date}", rl.BODY_STYLE))
+    elements.append(rl.Spacer(1, 0.3*rl.inch))
     
     # Total potential savings
-    total_savings = sum(opp.annualSavings for opp in session_data.opportunities)
+    total_savings = math.fsum(opp.annualSavings for opp in session_data.opportunities)
     savings_text = f"<b>Total Potential Annual Savings: {format_currency(total_savings)}</b>"
-    elements.append(Paragraph(savings_text, heading_style))
-    elements.append(Spacer(1, 0.2*inch))
+    elements.append(rl.Paragraph(savings_text, rl.HEADING_STYLE))
+    elements.append(rl.Spacer(1, 0.2*rl.inch))
     
     # Introduction
-    intro_text = """
-    Follow this crawl-walk-run approach: Start with Tier 1 to establish visibility, 
-    then work through each tier sequentially. Complete one tier before moving to the next.
-    """
-    elements.append(Paragraph(intro_text, body_style))
+    elements.append(rl.Paragraph(_INTRO_TEXT, rl.BODY_STYLE))
     
-    elements.append(PageBreak())
+    elements.append(rl.PageBreak())
     
     # Property Insights Summary
-    elements.append(Paragraph("Property Insights", heading_style))
-    elements.append(Spacer(1, 0.1*inch))
+    elements.append(rl.Paragraph("Property Insights", rl.HEADING_STYLE))
+    elements.append(rl.Spacer(1, 0.1*rl.inch))
     
     property_data = [
         ['Year Built', str(session_data.property_data.yearBuilt)],
@@ -212,41 +355,27 @@ def generate_report_pdf(session_data: Session) -> bytes:
         ['Solar Feasibility Score', f"{session_data.property_data.solarFeasibilityScore}/10"],
     ]
     
-    property_table = Table(property_data, colWidths=[2.5*inch, 3.5*inch])
-    property_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f3f4f6')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#1f2937')),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#d1d5db'))
-    ]))
+    property_table = rl.Table(property_data, colWidths=rl.PROPERTY_COL_WIDTHS)
+    property_table.setStyle(rl.PROPERTY_TABLE_STYLE)
     
     elements.append(property_table)
-    elements.append(Spacer(1, 0.3*inch))
+    elements.append(rl.Spacer(1, 0.3*rl.inch))
     
-    # Organize opportunities into tiers
-    tiers = organize_opportunities_into_tiers(session_data.opportunities)
+    # Classify and render every opportunity in a single pass, one flowable list per tier
+    tier_elements = _render_opportunities_by_tier(session_data.opportunities)
     
     # Tier 1: Special Instructions (always included)
-    elements.append(Paragraph(f"<b>Tier 1: {tiers[0].title}</b>", tier_title_style))
-    elements.append(Paragraph(tiers[0].description, body_style))
-    elements.append(Spacer(1, 0.1*inch))
+    _, tier1_title, tier1_description, _ = _TIER_TEMPLATES[0]
+    elements.append(rl.Paragraph(f"<b>Tier 1: {tier1_title}</b>", rl.TIER_TITLE_STYLE))
+    elements.append(rl.Paragraph(tier1_description, rl.BODY_STYLE))
+    elements.append(rl.Spacer(1, 0.1*rl.inch))
     
     # Build utility-specific instructions for Tier 1
     utility_provider = session_data.property_data.utilityProvider
-    utility_portal_text = ""
-    
-    if utility_provider == "LADWP":
-        utility_portal_text = "• LADWP account: ladwp.com (electricity & water)<br/>"
-    elif utility_provider == "Pasadena Water & Power":
-        utility_portal_text = "• Pasadena Water & Power: cityofpasadena.net/water-and-power<br/>"
-    elif utility_provider == "Glendale Water & Power":
-        utility_portal_text = "• Glendale Water & Power: glendaleca.gov/water-power<br/>"
-    elif utility_provider == "Burbank Water & Power":
-        utility_portal_text = "• Burbank Water & Power: burbankwaterandpower.com<br/>"
+    utility_info = _UTILITY_INFO.get(utility_provider)
+    
+    if utility_info:
+        utility_portal_text = utility_info[0]
     else:
         utility_portal_text = f"• {utility_provider}: Check your utility provider's website<br/>"
     
@@ -263,78 +392,37 @@ def generate_report_pdf(session_data: Session) -> bytes:
     <b>Why this matters:</b> This baseline data will help you measure the actual impact of every change you make.
     Spend 30-60 minutes on this step before moving to Tier 2.
     """
-    elements.append(Paragraph(tier1_instructions, small_style))
-    elements.append(Spacer(1, 0.2*inch))
+    elements.append(rl.Paragraph(tier1_instructions, rl.SMALL_STYLE))
+    elements.append(rl.Spacer(1, 0.2*rl.inch))
     
     # Remaining Tiers (2-5)
-    for tier_group in tiers[1:]:
-        elements.append(Paragraph(f"<b>Tier {tier_group.tier}: {tier_group.title}</b>", tier_title_style))
-        elements.append(Paragraph(tier_group.description, body_style))
-        elements.append(Spacer(1, 0.1*inch))
+    for tier, title, description, _ in _TIER_TEMPLATES[1:]:
+        elements.append(rl.Paragraph(f"<b>Tier {tier}: {title}</b>", rl.TIER_TITLE_STYLE))
+        elements.append(rl.Paragraph(description, rl.BODY_STYLE))
+        elements.append(rl.Spacer(1, 0.1*rl.inch))
         
-        if tier_group.opportunities:
-            for opp in tier_group.opportunities:
-                # Opportunity name and savings
-                opp_title = f"<b>{opp.name}</b>"
-                if opp.upfrontCost.max == 0:
-                    opp_title += " [FREE]"
-                opp_title += f" - Annual Savings: {format_currency(opp.annualSavings)}"
-                elements.append(Paragraph(opp_title, body_style))
-                
-                # Cost and difficulty
-                if opp.upfrontCost.max == 0:
-                    cost_text = "Your Cost: $0"
-                else:
-                    cost_text = f"Your Cost: {format_currency(opp.upfrontCost.min)}–{format_currency(opp.upfrontCost.max)}"
-                cost_text += f" | Effort: {opp.difficulty}"
-                elements.append(Paragraph(cost_text, small_style))
-                
-                # Benefits
-                if opp.benefits:
-                    elements.append(Paragraph(f"<i>{opp.benefits[0]}</i>", small_style))
-                
-                # Next steps
-                if opp.nextSteps:
-                    next_steps_text = "<b>Next Steps:</b><br/>"
-                    for i, step in enumerate(opp.nextSteps[:2], 1):
-                        next_steps_text += f"{i}. {step}<br/>"
-                    elements.append(Paragraph(next_steps_text, small_style))
-                
-                elements.append(Spacer(1, 0.15*inch))
+        if tier_elements[tier - 1]:
+            elements.extend(tier_elements[tier - 1])
         else:
-            elements.append(Paragraph(
+            elements.append(rl.Paragraph(
                 "No specific programs in this tier for your property. Move to the next tier when ready.",
-                small_style
+                rl.SMALL_STYLE
             ))
-            elements.append(Spacer(1, 0.1*inch))
+            elements.append(rl.Spacer(1, 0.1*rl.inch))
     
-    elements.append(PageBreak())
+    elements.append(rl.PageBreak())
     
     # Add Resources Section Header
-    elements.append(Paragraph("Program Resources & Contact Information", heading_style))
-    elements.append(Spacer(1, 0.1*inch))
-    elements.append(Paragraph(
+    elements.append(rl.Paragraph("Program Resources & Contact Information", rl.HEADING_STYLE))
+    elements.append(rl.Spacer(1, 0.1*rl.inch))
+    elements.append(rl.Paragraph(
         "Quick reference for all the programs, rebates, and services mentioned in your action plan",
-        small_style
+        rl.SMALL_STYLE
     ))
-    elements.append(Spacer(1, 0.2*inch))
+    elements.append(rl.Spacer(1, 0.2*rl.inch))
     
-    # Build utility contacts based on property's utility provider
-    utility_provider = session_data.property_data.utilityProvider
-    resources_data = []
-    
-    # Add relevant utility provider
-    if utility_provider == "LADWP":
-        resources_data.append(['LADWP', '(800) 342-5397', 'ladwp.com'])
-    elif utility_provider == "Pasadena Water & Power":
-        resources_data.append(['Pasadena Water & Power', '(626) 744-4005', 'cityofpasadena.net/water-and-power'])
-    elif utility_provider == "Glendale Water & Power":
-        resources_data.append(['Glendale Water & Power', '(818) 548-2000', 'glendaleca.gov/water-power'])
-    elif utility_provider == "Burbank Water & Power":
-        resources_data.append(['Burbank Water & Power', '(818) 238-3700', 'burbankwaterandpower.com'])
-    else:
-        # Default to LADWP if unknown
-        resources_data.append(['LADWP', '(800) 342-5397', 'ladwp.com'])
+    # Build utility contacts based on property's utility provider (LADWP if unknown)
+    resources_data = [list(utility_info[1] if utility_info else _UTILITY_INFO["LADWP"][1])]
     
     # Add SoCalGas (common for most properties)
     resources_data.append(['SoCalGas', '(877) 238-0092', 'socalgas.com/rebates'])
@@ -343,55 +431,25 @@ def generate_report_pdf(session_data: Session) -> bytes:
     resources_data.append(['LA County Weatherization', '(626) 569-4328', 'dcba.lacounty.gov/weatherization'])
     resources_data.append(['ENERGY STAR', '-', 'energystar.gov'])
     
-    resources_table = Table(resources_data, colWidths=[2.5*inch, 1.5*inch, 2.5*inch])
-    resources_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#f9fafb')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#1f2937')),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),  # Make first column bold
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#d1d5db')),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ]))
+    resources_table = rl.Table(resources_data, colWidths=rl.RESOURCES_COL_WIDTHS)
+    resources_table.setStyle(rl.RESOURCES_TABLE_STYLE)
     
     elements.append(resources_table)
-    elements.append(Spacer(1, 0.3*inch))
+    elements.append(rl.Spacer(1, 0.3*rl.inch))
     
     # Key Principles for Success
-    elements.append(Paragraph("Key Principles for Success", heading_style))
-    elements.append(Spacer(1, 0.1*inch))
+    elements.append(rl.Paragraph("Key Principles for Success", rl.HEADING_STYLE))
+    elements.append(rl.Spacer(1, 0.1*rl.inch))
     
-    principles = """
-    • <b>Complete Tier 1 first:</b> Establish your baseline before making any changes<br/>
-    • <b>Track everything:</b> Document the date of each change and compare monthly bills<br/>
-    • <b>Wait 3-6 months:</b> Before major investments (Tier 5), verify your usage patterns with data<br/>
-    • <b>Start with free programs:</b> Maximize no-cost opportunities before spending money<br/>
-    • <b>Use your data:</b> Let actual usage inform which upgrades make sense for your home
-    """
-    elements.append(Paragraph(principles, body_style))
-    elements.append(Spacer(1, 0.3*inch))
+    elements.append(rl.Paragraph(_PRINCIPLES_TEXT, rl.BODY_STYLE))
+    elements.append(rl.Spacer(1, 0.3*rl.inch))
     
     # Footer with HOCS branding
-    footer_style = ParagraphStyle(
-        'Footer',
-        parent=styles['Normal'],
-        fontSize=8,
-        textColor=colors.HexColor('#6b7280'),
-        alignment=TA_CENTER
-    )
-    elements.append(Spacer(1, 0.5*inch))
-    elements.append(Paragraph(
-        f"Generated by <b>HOCS</b> - Home Ownership Cost Savings | {datetime.now().strftime('%B %d, %Y')}",
-        footer_style
+    elements.append(rl.Spacer(1, 0.5*rl.inch))
+    elements.append(rl.Paragraph(
+        f"Generated by <b>HOCS</b> - Home Ownership Cost Savings | {generated_date}",
+        rl.FOOTER_STYLE
     ))
     
     # Build PDF
-    doc.build(elements)
-    
-    # Get the value of the BytesIO buffer
-    pdf_bytes = buffer.getvalue()
-    buffer.close()
-    
-    return pdf_bytes
\ No newline at end of file
+    doc.build(elements)
\ No newline at end of file
@@ -2,13 +2,21 @@
 Utility Lookup Service for California addresses.
 Identifies electric, gas, and water providers based on address location.
 """
-from typing import Dict, Optional
+import re
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# Accepted (lowercased) state values; an empty state is assumed to be California
+_SUPPORTED_STATES = frozenset({"california", "ca", ""})
+
+# East Bay cities served by EBMUD (substring match against the lowercased city)
+_EBMUD_CITIES = re.compile(r"oakland|berkeley|richmond")
+
 
 class UtilityType(str, Enum):
     ELECTRIC = "electric"
@@ -16,7 +24,7 @@ class UtilityType(str, Enum):
     WATER = "water"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UtilityProvider:
     """Represents a utility provider"""
     name: str
@@ -26,6 +34,20 @@ class UtilityProvider:
     programs_url: Optional[str] = None
     rebates_url: Optional[str] = None
     phone: Optional[str] = None
+    # Stable identifier (the provider's key in CaliforniaUtilityDatabase.ALL_PROVIDERS)
+    code: Optional[str] = None
+    # API payload for this provider, built once since providers are immutable
+    as_dict: Dict[str, Optional[str]] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'as_dict', {
+            "name": self.name,
+            "website": self.website,
+            "programs_url": self.programs_url,
+            "rebates_url": self.rebates_url,
+            "phone": self.phone,
+            "service_area": self.service_area
+        })
 
 
 class CaliforniaUtilityDatabase:
@@ -34,6 +56,7 @@ class CaliforniaUtilityDatabase:
     # Major Electric Utilities in California
     ELECTRIC_UTILITIES = {
         "SCE": UtilityProvider(
+            code="SCE",
             name="Southern California Edison",
             utility_type=UtilityType.ELECTRIC,
             service_area="Southern California (excluding LA City, San Diego, includes Irvine)",
@@ -43,6 +66,7 @@ class CaliforniaUtilityDatabase:
             phone="1-800-655-4555"
         ),
         "PGE": UtilityProvider(
+            code="PGE",
             name="Pacific Gas and Electric",
             utility_type=UtilityType.ELECTRIC,
             service_area="Northern and Central California",
@@ -52,6 +76,7 @@ class CaliforniaUtilityDatabase:
             phone="1-800-743-5000"
         ),
         "SDGE": UtilityProvider(
+            code="SDGE",
             name="San Diego Gas & Electric",
             utility_type=UtilityType.ELECTRIC,
             service_area="San Diego and southern Orange County",
@@ -61,6 +86,7 @@ class CaliforniaUtilityDatabase:
             phone="1-800-411-7343"
         ),
         "LADWP": UtilityProvider(
+            code="LADWP",
             name="Los Angeles Department of Water and Power",
             utility_type=UtilityType.ELECTRIC,
             service_area="City of Los Angeles",
@@ -70,6 +96,7 @@ class CaliforniaUtilityDatabase:
             phone="1-800-342-5397"
         ),
         "SMUD": UtilityProvider(
+            code="SMUD",
             name="Sacramento Municipal Utility District",
             utility_type=UtilityType.ELECTRIC,
             service_area="Sacramento County",
@@ -83,6 +110,7 @@ class CaliforniaUtilityDatabase:
     # Major Gas Utilities in California
     GAS_UTILITIES = {
         "SOCALGAS": UtilityProvider(
+            code="SOCALGAS",
             name="Southern California Gas Company",
             utility_type=UtilityType.GAS,
             service_area="Southern California",
@@ -92,6 +120,7 @@ class CaliforniaUtilityDatabase:
             phone="1-877-238-0092"
         ),
         "PGE_GAS": UtilityProvider(
+            code="PGE_GAS",
             name="Pacific Gas and Electric",
             utility_type=UtilityType.GAS,
             service_area="Northern and Central California",
@@ -101,6 +130,7 @@ class CaliforniaUtilityDatabase:
             phone="1-800-743-5000"
         ),
         "SDGE_GAS": UtilityProvider(
+            code="SDGE_GAS",
             name="San Diego Gas & Electric",
             utility_type=UtilityType.GAS,
             service_area="San Diego and southern Orange County",
@@ -114,6 +144,7 @@ class CaliforniaUtilityDatabase:
     # Water utilities are more localized - these are major ones
     WATER_UTILITIES = {
         "IRWD": UtilityProvider(
+            code="IRWD",
             name="Irvine Ranch Water District",
             utility_type=UtilityType.WATER,
             service_area="Irvine and surrounding areas",
@@ -123,6 +154,7 @@ class CaliforniaUtilityDatabase:
             phone="1-949-453-5300"
         ),
         "LADWP_WATER": UtilityProvider(
+            code="LADWP_WATER",
             name="Los Angeles Department of Water and Power",
             utility_type=UtilityType.WATER,
             service_area="City of Los Angeles",
@@ -132,6 +164,7 @@ class CaliforniaUtilityDatabase:
             phone="1-800-342-5397"
         ),
         "EBMUD": UtilityProvider(
+            code="EBMUD",
             name="East Bay Municipal Utility District",
             utility_type=UtilityType.WATER,
             service_area="East Bay Area",
@@ -141,6 +174,7 @@ class CaliforniaUtilityDatabase:
             phone="1-866-403-2683"
         ),
         "SDCWA": UtilityProvider(
+            code="SDCWA",
             name="San Diego County Water Authority",
             utility_type=UtilityType.WATER,
             service_area="San Diego County",
@@ -150,6 +184,7 @@ class CaliforniaUtilityDatabase:
             phone="1-858-522-6700"
         ),
         "MWD": UtilityProvider(
+            code="MWD",
             name="Metropolitan Water District of Southern California",
             utility_type=UtilityType.WATER,
             service_area="Southern California (regional)",
@@ -160,6 +195,9 @@ class CaliforniaUtilityDatabase:
         ),
     }
     
+    # Every provider by utility code (codes are unique across utility types)
+    ALL_PROVIDERS = {**ELECTRIC_UTILITIES, **GAS_UTILITIES, **WATER_UTILITIES}
+    
     # Geographic boundaries for utility service areas (approximate)
     # Format: (min_lat, max_lat, min_lon, max_lon)
     SERVICE_AREA_BOUNDARIES = {
@@ -189,102 +227,119 @@ class UtilityLookupService:
     
     def __init__(self):
         self.db = CaliforniaUtilityDatabase()
+        # Utilities that share a boundary (e.g. SCE/SoCalGas, PG&E electric/gas) are
+        # grouped so each distinct service area is tested once per lookup
+        service_areas: Dict[Tuple[float, float, float, float], List[str]] = {}
+        for utility_code, bounds in self.db.SERVICE_AREA_BOUNDARIES.items():
+            service_areas.setdefault(bounds, []).append(utility_code)
+        self._service_areas: Tuple[Tuple[Tuple[float, float, float, float], FrozenSet[str]], ...] = tuple(
+            (bounds, frozenset(utility_codes)) for bounds, utility_codes in service_areas.items()
+        )
+        # Detection depends only on the coordinates and lowercased city/county,
+        # and geocoded properties are looked up repeatedly, so results are memoized
+        self._detect_cached = lru_cache(maxsize=8192)(self._detect_utilities)
     
-    def _is_in_service_area(self, lat: float, lon: float, utility_code: str) -> bool:
-        """Check if coordinates fall within a utility's service area"""
-        if utility_code not in self.db.SERVICE_AREA_BOUNDARIES:
-            return False
-        
-        min_lat, max_lat, min_lon, max_lon = self.db.SERVICE_AREA_BOUNDARIES[utility_code]
-        return min_lat <= lat <= max_lat and min_lon <= lon <= max_lon
+    def _service_areas_containing(self, lat: float, lon: float) -> Set[str]:
+        """Codes of every utility whose service area contains the coordinates"""
+        utility_codes: Set[str] = set()
+        for (min_lat, max_lat, min_lon, max_lon), area_codes in self._service_areas:
+            if min_lat <= lat <= max_lat and min_lon <= lon <= max_lon:
+                utility_codes |= area_codes
+        return utility_codes
     
-    def _detect_electric_utility(self, lat: float, lon: float, city: str, county: str) -> Optional[UtilityProvider]:
-        """Detect electric utility based on location"""
-        city_lower = city.lower()
-        county_lower = county.lower()
-        
+    def _detect_electric_utility(self, lat: float, areas: Set[str], city_lower: str, county_lower: str) -> Optional[UtilityProvider]:
+        """Detect electric utility from the service areas containing the location (city and county already lowercased)"""
         # Check LADWP first (LA City)
-        if "los angeles" in city_lower and self._is_in_service_area(lat, lon, "LADWP"):
-            return self.db.ELECTRIC_UTILITIES["LADWP"]
+        if "los angeles" in city_lower and "LADWP" in areas:
+            return self.db.ALL_PROVIDERS["LADWP"]
         
         # Check SMUD (Sacramento)
         if "sacramento" in city_lower or "sacramento" in county_lower:
-            if self._is_in_service_area(lat, lon, "SMUD"):
-                return self.db.ELECTRIC_UTILITIES["SMUD"]
+            if "SMUD" in areas:
+                return self.db.ALL_PROVIDERS["SMUD"]
         
         # Check SDGE (San Diego)
         if "san diego" in county_lower or "san diego" in city_lower:
-            if self._is_in_service_area(lat, lon, "SDGE"):
-                return self.db.ELECTRIC_UTILITIES["SDGE"]
+            if "SDGE" in areas:
+                return self.db.ALL_PROVIDERS["SDGE"]
         
         # Check PGE (Northern/Central CA)
-        if self._is_in_service_area(lat, lon, "PGE"):
-            return self.db.ELECTRIC_UTILITIES["PGE"]
+        if "PGE" in areas:
+            return self.db.ALL_PROVIDERS["PGE"]
         
         # Check SCE (Southern CA - default for southern areas)
-        if self._is_in_service_area(lat, lon, "SCE"):
-            return self.db.ELECTRIC_UTILITIES["SCE"]
+        if "SCE" in areas:
+            return self.db.ALL_PROVIDERS["SCE"]
         
         # Default to SCE for Southern CA, PGE for Northern CA
         if lat < 36.0:
-            return self.db.ELECTRIC_UTILITIES["SCE"]
+            return self.db.ALL_PROVIDERS["SCE"]
         else:
-            return self.db.ELECTRIC_UTILITIES["PGE"]
+            return self.db.ALL_PROVIDERS["PGE"]
     
-    def _detect_gas_utility(self, lat: float, lon: float, city: str, county: str) -> Optional[UtilityProvider]:
-        """Detect gas utility based on location"""
-        city_lower = city.lower()
-        county_lower = county.lower()
-        
+    def _detect_gas_utility(self, lat: float, areas: Set[str], city_lower: str, county_lower: str) -> Optional[UtilityProvider]:
+        """Detect gas utility from the service areas containing the location (city and county already lowercased)"""
         # Check SDGE (San Diego)
         if "san diego" in county_lower or "san diego" in city_lower:
-            if self._is_in_service_area(lat, lon, "SDGE_GAS"):
-                return self.db.GAS_UTILITIES["SDGE_GAS"]
+            if "SDGE_GAS" in areas:
+                return self.db.ALL_PROVIDERS["SDGE_GAS"]
         
         # Check PGE (Northern/Central CA)
-        if self._is_in_service_area(lat, lon, "PGE_GAS"):
-            return self.db.GAS_UTILITIES["PGE_GAS"]
+        if "PGE_GAS" in areas:
+            return self.db.ALL_PROVIDERS["PGE_GAS"]
         
         # Check SoCalGas (Southern CA)
-        if self._is_in_service_area(lat, lon, "SOCALGAS"):
-            return self.db.GAS_UTILITIES["SOCALGAS"]
+        if "SOCALGAS" in areas:
+            return self.db.ALL_PROVIDERS["SOCALGAS"]
         
         # Default based on latitude
         if lat < 36.0:
-            return self.db.GAS_UTILITIES["SOCALGAS"]
+            return self.db.ALL_PROVIDERS["SOCALGAS"]
         else:
-            return self.db.GAS_UTILITIES["PGE_GAS"]
+            return self.db.ALL_PROVIDERS["PGE_GAS"]
     
-    def _detect_water_utility(self, lat: float, lon: float, city: str, county: str) -> Optional[UtilityProvider]:
-        """Detect water utility based on location"""
-        city_lower = city.lower()
-        county_lower = county.lower()
-        
+    def _detect_water_utility(self, lat: float, areas: Set[str], city_lower: str, county_lower: str) -> Optional[UtilityProvider]:
+        """Detect water utility from the service areas containing the location (city and county already lowercased)"""
         # Check Irvine Ranch Water District
-        if "irvine" in city_lower and self._is_in_service_area(lat, lon, "IRWD"):
-            return self.db.WATER_UTILITIES["IRWD"]
+        if "irvine" in city_lower and "IRWD" in areas:
+            return self.db.ALL_PROVIDERS["IRWD"]
         
         # Check LADWP (LA City)
-        if "los angeles" in city_lower and self._is_in_service_area(lat, lon, "LADWP_WATER"):
-            return self.db.WATER_UTILITIES["LADWP_WATER"]
+        if "los angeles" in city_lower and "LADWP_WATER" in areas:
+            return self.db.ALL_PROVIDERS["LADWP_WATER"]
         
         # Check EBMUD (East Bay)
-        if any(city_name in city_lower for city_name in ["oakland", "berkeley", "richmond"]):
-            if self._is_in_service_area(lat, lon, "EBMUD"):
-                return self.db.WATER_UTILITIES["EBMUD"]
+        if _EBMUD_CITIES.search(city_lower):
+            if "EBMUD" in areas:
+                return self.db.ALL_PROVIDERS["EBMUD"]
         
         # Check San Diego County Water Authority
         if "san diego" in county_lower:
-            if self._is_in_service_area(lat, lon, "SDCWA"):
-                return self.db.WATER_UTILITIES["SDCWA"]
+            if "SDCWA" in areas:
+                return self.db.ALL_PROVIDERS["SDCWA"]
         
         # Check MWD (Southern California regional)
-        if self._is_in_service_area(lat, lon, "MWD"):
-            return self.db.WATER_UTILITIES["MWD"]
+        if "MWD" in areas:
+            return self.db.ALL_PROVIDERS["MWD"]
         
         # Water utilities are very localized, return None if no match
         return None
     
+    def _detect_utilities(
+        self,
+        lat: float,
+        lon: float,
+        city_lower: str,
+        county_lower: str
+    ) -> Tuple[Optional[UtilityProvider], Optional[UtilityProvider], Optional[UtilityProvider]]:
+        """Detect the electric, gas, and water utilities for a location in one pass over the service areas"""
+        areas = self._service_areas_containing(lat, lon)
+        return (
+            self._detect_electric_utility(lat, areas, city_lower, county_lower),
+            self._detect_gas_utility(lat, areas, city_lower, county_lower),
+            self._detect_water_utility(lat, areas, city_lower, county_lower)
+        )
+    
     def lookup_utilities(
         self,
         latitude: float,
@@ -306,50 +361,47 @@ class UtilityLookupService:
         Returns:
             Dictionary with electric, gas, and water utility providers
         """
-        if state.lower() not in ["california", "ca", ""]:
-            logger.warning(f"Utility lookup only supports California addresses. Got: {state}")
+        # "CA" is what every caller passes, so skip lowercasing in that case
+        if state != "CA" and state.lower() not in _SUPPORTED_STATES:
+            logger.warning("Utility lookup only supports California addresses. Got: %s", state)
             return {
                 "electric": None,
                 "gas": None,
                 "water": None
             }
         
-        try:
-            electric = self._detect_electric_utility(latitude, longitude, city, county)
-            gas = self._detect_gas_utility(latitude, longitude, city, county)
-            water = self._detect_water_utility(latitude, longitude, city, county)
-            
-            logger.info(f"Utilities found for {city}, {county}: Electric={electric.name if electric else 'None'}, "
-                       f"Gas={gas.name if gas else 'None'}, Water={water.name if water else 'None'}")
-            
-            return {
-                "electric": electric,
-                "gas": gas,
-                "water": water
-            }
-        except Exception as e:
-            logger.error(f"Error looking up utilities: {str(e)}")
+        # Detection is plain comparisons and lookups, so validating the inputs here
+        # is all the guarding it needs (this also rejects NaN coordinates)
+        if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+            logger.warning("Utility lookup got invalid coordinates: %s, %s", latitude, longitude)
             return {
                 "electric": None,
                 "gas": None,
                 "water": None
             }
-    
-    def get_utility_info(self, utilities: Dict[str, Optional[UtilityProvider]]) -> Dict:
-        """Convert utility providers to dictionary format for API response"""
-        result = {}
         
-        for utility_type, provider in utilities.items():
-            if provider:
-                result[utility_type] = {
-                    "name": provider.name,
-                    "website": provider.website,
-                    "programs_url": provider.programs_url,
-                    "rebates_url": provider.rebates_url,
-                    "phone": provider.phone,
-                    "service_area": provider.service_area
-                }
-            else:
-                result[utility_type] = None
+        electric, gas, water = self._detect_cached(latitude, longitude, city.lower(), county.lower())
+        
+        # Formatted only when INFO is enabled
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Utilities found for %s, %s: Electric=%s, Gas=%s, Water=%s",
+                        city, county,
+                        electric.name if electric else None,
+                        gas.name if gas else None,
+                        water.name if water else None)
         
-        return result
\ No newline at end of file
+        return {
+            "electric": electric,
+            "gas": gas,
+            "water": water
+        }
+    
+    def get_utility_info(self, utilities: Dict[str, Optional[UtilityProvider]]) -> Dict:
+        """
+        Convert utility providers to dictionary format for API response
+        Each provider's entry is shared across calls; treat it as read-only
+        """
+        return {
+            utility_type: provider.as_dict if provider else None
+            for utility_type, provider in utilities.items()
+        }
@@ -2,12 +2,13 @@
 Utility Program Service for California utility providers.
 Provides detailed program information, rebates, and resources for specific utilities.
 """
-from typing import List, Dict, Optional
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
+import json
 from enum import Enum
 import logging
 
-from services.utility_lookup_service import UtilityProvider, UtilityType
+from services.utility_lookup_service import UtilityProvider
 
 logger = logging.getLogger(__name__)
 
@@ -22,31 +23,51 @@ class ProgramCategory(str, Enum):
     INSULATION = "insulation"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UtilityProgram:
     """Represents a utility-specific program or rebate"""
     name: str
     category: ProgramCategory
     description: str
     rebate_amount: Optional[str]  # e.g., "$300" or "$2/sqft" or "Up to $1,000"
-    eligibility: List[str]
+    eligibility: Tuple[str, ...]
     application_url: str
     phone: Optional[str] = None
     income_qualified: bool = False
     notes: Optional[str] = None
+    # API payload for this program (and its JSON encoding), built once since the program database is static
+    as_dict: Dict = field(init=False, repr=False, compare=False)
+    as_json: bytes = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'as_dict', {
+            "name": self.name,
+            "category": self.category.value,
+            "description": self.description,
+            "rebate_amount": self.rebate_amount,
+            "eligibility": list(self.eligibility),
+            "application_url": self.application_url,
+            "phone": self.phone,
+            "income_qualified": self.income_qualified,
+            "notes": self.notes
+        })
+        # Same encoding FastAPI's JSONResponse uses, so pre-serialized responses match it byte for byte
+        object.__setattr__(self, 'as_json', json.dumps(
+            self.as_dict, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8"))
 
 
 class UtilityProgramDatabase:
     """Database of utility-specific programs and rebates"""
     
     # Southern California Edison (SCE) Programs
-    SCE_PROGRAMS = [
+    SCE_PROGRAMS = (
         UtilityProgram(
             name="Home Energy Advisor",
             category=ProgramCategory.ENERGY_EFFICIENCY,
             description="Free online tool and personalized recommendations for energy savings",
             rebate_amount="Free",
-            eligibility=["All SCE residential customers"],
+            eligibility=("All SCE residential customers",),
             application_url="https://www.sce.com/residential/rebates-savings/home-energy-advisor",
             phone="1-800-655-4555"
         ),
@@ -55,7 +76,7 @@ class UtilityProgramDatabase:
             category=ProgramCategory.HVAC,
             description="Rebate for purchasing and installing qualifying smart thermostats",
             rebate_amount="$75-$120",
-            eligibility=["SCE residential customers", "Must purchase qualifying ENERGY STAR thermostat"],
+            eligibility=("SCE residential customers", "Must purchase qualifying ENERGY STAR thermostat"),
             application_url="https://www.sce.com/residential/rebates-savings/rebates-by-product/smart-thermostat",
             phone="1-800-655-4555"
         ),
@@ -64,7 +85,7 @@ class UtilityProgramDatabase:
             category=ProgramCategory.WEATHERIZATION,
             description="Free energy-saving improvements for income-qualified customers",
             rebate_amount="Free",
-            eligibility=["Income at or below 200% of federal poverty guidelines"],
+            eligibility=("Income at or below 200% of federal poverty guidelines",),
             application_url="https://www.sce.com/residential/assistance/energy-savings-assistance-program",
             phone="1-800-655-4555",
             income_qualified=True
@@ -74,20 +95,20 @@ class UtilityProgramDatabase:
             category=ProgramCategory.APPLIANCE_REBATE,
             description="Rebates for energy-efficient appliances including refrigerators, washers, and pool pumps",
             rebate_amount="$50-$400",
-            eligibility=["SCE residential customers", "Must purchase qualifying ENERGY STAR appliances"],
+            eligibility=("SCE residential customers", "Must purchase qualifying ENERGY STAR appliances"),
             application_url="https://www.sce.com/residential/rebates-savings/rebates-by-product",
             phone="1-800-655-4555"
         ),
-    ]
+    )
     
     # Pacific Gas & Electric (PG&E) Programs
-    PGE_PROGRAMS = [
+    PGE_PROGRAMS = (
         UtilityProgram(
             name="Home Energy Checkup",
             category=ProgramCategory.ENERGY_EFFICIENCY,
             description="Free in-home energy assessment with instant savings measures",
             rebate_amount="Free",
-            eligibility=["All PG&E residential customers"],
+            eligibility=("All PG&E residential customers",),
             application_url="https://www.pge.com/en_US/residential/save-energy-money/savings-solutions-and-rebates/home-energy-checkup/home-energy-checkup.page",
             phone="1-800-743-5000"
         ),
@@ -96,7 +117,7 @@ class UtilityProgramDatabase:
             category=ProgramCategory.APPLIANCE_REBATE,
             description="Rebates for energy-efficient appliances, HVAC, and water heaters",
             rebate_amount="$50-$6,000",
-            eligibility=["PG&E residential customers", "Varies by product"],
+            eligibility=("PG&E residential customers", "Varies by product"),
             application_url="https://www.pge.com/en_US/residential/save-energy-money/savings-solutions-and-rebates/rebates-and-incentives/rebates-and-incentives.page",
             phone="1-800-743-5000"
         ),
@@ -105,21 +126,21 @@ class UtilityProgramDatabase:
             category=ProgramCategory.WEATHERIZATION,
             description="Free weatherization and energy efficiency upgrades for income-qualified households",
             rebate_amount="Free",
-            eligibility=["Income at or below 200% of federal poverty guidelines"],
+            eligibility=("Income at or below 200% of federal poverty guidelines",),
             application_url="https://www.pge.com/en_US/residential/save-energy-money/help-paying-your-bill/longer-term-assistance/energy-savings-assistance-program/energy-savings-assistance-program.page",
             phone="1-866-743-2752",
             income_qualified=True
         ),
-    ]
+    )
     
     # San Diego Gas & Electric (SDG&E) Programs
-    SDGE_PROGRAMS = [
+    SDGE_PROGRAMS = (
         UtilityProgram(
             name="Home Energy Savings Program",
             category=ProgramCategory.ENERGY_EFFICIENCY,
             description="Free home energy assessment and instant savings measures",
             rebate_amount="Free",
-            eligibility=["All SDG&E residential customers"],
+            eligibility=("All SDG&E residential customers",),
             application_url="https://www.sdge.com/residential/savings-center/energy-management-programs/home-energy-savings-program",
             phone="1-800-411-7343"
         ),
@@ -128,7 +149,7 @@ class UtilityProgramDatabase:
             category=ProgramCategory.APPLIANCE_REBATE,
             description="Rebates for ENERGY STAR appliances and equipment",
             rebate_amount="$50-$3,000",
-            eligibility=["SDG&E residential customers", "Must purchase qualifying products"],
+            eligibility=("SDG&E residential customers", "Must purchase qualifying products"),
             application_url="https://www.sdge.com/residential/savings-center/rebates-incentives",
             phone="1-800-411-7343"
         ),
@@ -137,21 +158,21 @@ class UtilityProgramDatabase:
             category=ProgramCategory.WEATHERIZATION,
             description="Free energy efficiency improvements for income-qualified customers",
             rebate_amount="Free",
-            eligibility=["Income at or below 200% of federal poverty guidelines"],
+            eligibility=("Income at or below 200% of federal poverty guidelines",),
             application_url="https://www.sdge.com/residential/savings-center/energy-assistance-programs/energy-savings-assistance-program",
             phone="1-877-646-5525",
             income_qualified=True
         ),
-    ]
+    )
     
     # Los Angeles Department of Water and Power (LADWP) Programs
-    LADWP_PROGRAMS = [
+    LADWP_PROGRAMS = (
         UtilityProgram(
             name="Refrigerator Exchange Program",
             category=ProgramCategory.APPLIANCE_REBATE,
             description="Free pickup and recycling of old refrigerator plus $50 incentive",
             rebate_amount="$50",
-            eligibility=["LADWP residential customers", "Working refrigerator 10+ years old"],
+            eligibility=("LADWP residential customers", "Working refrigerator 10+ years old"),
             application_url="https://www.ladwp.com/ladwp/faces/ladwp/residential/r-savemoney/r-sm-rebatesandprograms/r-sm-rp-appliancerecycling",
             phone="1-800-246-0441"
         ),
@@ -160,7 +181,7 @@ class UtilityProgramDatabase:
             category=ProgramCategory.ENERGY_EFFICIENCY,
             description="Rebates for LED bulbs and fixtures",
             rebate_amount="Varies",
-            eligibility=["LADWP residential customers"],
+            eligibility=("LADWP residential customers",),
             application_url="https://www.ladwp.com/ladwp/faces/ladwp/residential/r-savemoney/r-sm-rebatesandprograms",
             phone="1-800-342-5397"
         ),
@@ -169,7 +190,7 @@ class UtilityProgramDatabase:
             category=ProgramCategory.WATER_CONSERVATION,
             description="Rebate for replacing grass with water-efficient landscaping",
             rebate_amount="$3 per square foot",
-            eligibility=["LADWP water customers", "Minimum 500 sqft removal"],
+            eligibility=("LADWP water customers", "Minimum 500 sqft removal"),
             application_url="https://www.ladwp.com/ladwp/faces/ladwp/residential/r-savemoney/r-sm-watersavingprograms/r-sm-wsp-turfreplacement",
             phone="1-800-544-4498"
         ),
@@ -178,21 +199,21 @@ class UtilityProgramDatabase:
             category=ProgramCategory.WEATHERIZATION,
             description="Free weatherization and energy efficiency upgrades for income-qualified customers",
             rebate_amount="Free",
-            eligibility=["Income at or below 200% of federal poverty guidelines"],
+            eligibility=("Income at or below 200% of federal poverty guidelines",),
             application_url="https://www.ladwp.com/ladwp/faces/ladwp/residential/r-savemoney/r-sm-rebatesandprograms",
             phone="1-800-342-5397",
             income_qualified=True
         ),
-    ]
+    )
     
     # Southern California Gas Company (SoCalGas) Programs
-    SOCALGAS_PROGRAMS = [
+    SOCALGAS_PROGRAMS = (
         UtilityProgram(
             name="Energy Savings Assistance Program",
             category=ProgramCategory.WEATHERIZATION,
             description="Free energy-saving improvements for income-qualified customers",
             rebate_amount="Free",
-            eligibility=["Income at or below 200% of federal poverty guidelines"],
+            eligibility=("Income at or below 200% of federal poverty guidelines",),
             application_url="https://www.socalgas.com/save-money-and-energy/assistance-programs/energy-savings-assistance-program",
             phone="1-800-331-7593",
             income_qualified=True
@@ -202,7 +223,7 @@ class UtilityProgramDatabase:
             category=ProgramCategory.APPLIANCE_REBATE,
             description="Rebates for high-efficiency water heaters",
             rebate_amount="$300-$1,800",
-            eligibility=["SoCalGas residential customers", "Must install qualifying equipment"],
+            eligibility=("SoCalGas residential customers", "Must install qualifying equipment"),
             application_url="https://www.socalgas.com/save-money-and-energy/rebates-and-incentives/water-heating",
             phone="1-877-238-0092"
         ),
@@ -211,20 +232,20 @@ class UtilityProgramDatabase:
             category=ProgramCategory.HVAC,
             description="Rebates for high-efficiency furnaces",
             rebate_amount="$300-$800",
-            eligibility=["SoCalGas residential customers", "Must install qualifying ENERGY STAR furnace"],
+            eligibility=("SoCalGas residential customers", "Must install qualifying ENERGY STAR furnace"),
             application_url="https://www.socalgas.com/save-money-and-energy/rebates-and-incentives/heating-and-cooling",
             phone="1-877-238-0092"
         ),
-    ]
+    )
     
     # Sacramento Municipal Utility District (SMUD) Programs
-    SMUD_PROGRAMS = [
+    SMUD_PROGRAMS = (
         UtilityProgram(
             name="Home Performance Program",
             category=ProgramCategory.ENERGY_EFFICIENCY,
             description="Comprehensive home energy assessment and rebates for improvements",
             rebate_amount="Up to $4,500",
-            eligibility=["SMUD residential customers"],
+            eligibility=("SMUD residential customers",),
             application_url="https://www.smud.org/en/Rate-Information/Residential-rates/Rebates-and-programs/Home-Performance-Program",
             phone="1-888-742-7683"
         ),
@@ -233,20 +254,20 @@ class UtilityProgramDatabase:
             category=ProgramCategory.APPLIANCE_REBATE,
             description="Rebates for energy-efficient appliances",
             rebate_amount="$50-$300",
-            eligibility=["SMUD residential customers", "Must purchase qualifying appliances"],
+            eligibility=("SMUD residential customers", "Must purchase qualifying appliances"),
             application_url="https://www.smud.org/en/Rate-Information/Residential-rates/Rebates-and-programs",
             phone="1-888-742-7683"
         ),
-    ]
+    )
     
     # Metropolitan Water District (MWD) Programs
-    MWD_PROGRAMS = [
+    MWD_PROGRAMS = (
         UtilityProgram(
             name="Turf Replacement Program",
             category=ProgramCategory.WATER_CONSERVATION,
             description="Rebate for replacing grass with water-efficient landscaping",
             rebate_amount="$2 per square foot",
-            eligibility=["MWD member agency customers", "Minimum 500 sqft removal"],
+            eligibility=("MWD member agency customers", "Minimum 500 sqft removal"),
             application_url="https://www.bewaterwise.com/turf-replacement",
             phone="1-800-CALL-MWD"
         ),
@@ -255,11 +276,64 @@ class UtilityProgramDatabase:
             category=ProgramCategory.WATER_CONSERVATION,
             description="Rebates for water-efficient devices and fixtures",
             rebate_amount="Varies",
-            eligibility=["MWD member agency customers"],
+            eligibility=("MWD member agency customers",),
             application_url="https://www.bewaterwise.com/rebates",
             phone="1-800-CALL-MWD"
         ),
-    ]
+    )
+
+
+def _match_utility_programs(utility_name: str) -> Optional[Tuple[UtilityProgram, ...]]:
+    """Match a lowercased utility name to its program list, or None if it has none"""
+    db = UtilityProgramDatabase
+    
+    # Map utility names to program lists
+    if "southern california edison" in utility_name or "sce" in utility_name:
+        return db.SCE_PROGRAMS
+    elif "pacific gas and electric" in utility_name or "pg&e" in utility_name or "pge" in utility_name:
+        return db.PGE_PROGRAMS
+    elif "san diego gas" in utility_name or "sdg&e" in utility_name:
+        return db.SDGE_PROGRAMS
+    elif "los angeles department of water and power" in utility_name or "ladwp" in utility_name:
+        return db.LADWP_PROGRAMS
+    elif "southern california gas" in utility_name or "socalgas" in utility_name:
+        return db.SOCALGAS_PROGRAMS
+    elif "sacramento municipal" in utility_name or "smud" in utility_name:
+        return db.SMUD_PROGRAMS
+    elif "metropolitan water district" in utility_name or "mwd" in utility_name:
+        return db.MWD_PROGRAMS
+    return None
+
+
+# Programs for each provider code from CaliforniaUtilityDatabase, matching what the name
+# checks above return for that provider; codes without programs (IRWD, EBMUD, SDCWA) are absent
+_PROGRAMS_BY_UTILITY_CODE: Dict[str, Tuple[UtilityProgram, ...]] = {
+    "SCE": UtilityProgramDatabase.SCE_PROGRAMS,
+    "PGE": UtilityProgramDatabase.PGE_PROGRAMS,
+    "PGE_GAS": UtilityProgramDatabase.PGE_PROGRAMS,
+    "SDGE": UtilityProgramDatabase.SDGE_PROGRAMS,
+    "SDGE_GAS": UtilityProgramDatabase.SDGE_PROGRAMS,
+    "LADWP": UtilityProgramDatabase.LADWP_PROGRAMS,
+    "LADWP_WATER": UtilityProgramDatabase.LADWP_PROGRAMS,
+    "SOCALGAS": UtilityProgramDatabase.SOCALGAS_PROGRAMS,
+    "SMUD": UtilityProgramDatabase.SMUD_PROGRAMS,
+    "MWD": UtilityProgramDatabase.MWD_PROGRAMS,
+}
+
+# Each utility's programs grouped by category (original order kept), built once at import
+_PROGRAMS_BY_CATEGORY: Dict[str, Dict[ProgramCategory, Tuple[UtilityProgram, ...]]] = {
+    utility_code: {
+        category: tuple(p for p in programs if p.category == category)
+        for category in dict.fromkeys(p.category for p in programs)
+    }
+    for utility_code, programs in _PROGRAMS_BY_UTILITY_CODE.items()
+}
+
+# Each utility's complete JSON program array, built once at import so responses join whole arrays
+_PROGRAMS_JSON_BY_UTILITY_CODE: Dict[str, bytes] = {
+    utility_code: b"[" + b",".join(p.as_json for p in programs) + b"]"
+    for utility_code, programs in _PROGRAMS_BY_UTILITY_CODE.items()
+}
 
 
 class UtilityProgramService:
@@ -268,7 +342,7 @@ class UtilityProgramService:
     def __init__(self):
         self.db = UtilityProgramDatabase()
     
-    def get_programs_for_utility(self, utility_provider: UtilityProvider) -> List[UtilityProgram]:
+    def get_programs_for_utility(self, utility_provider: UtilityProvider) -> Tuple[UtilityProgram, ...]:
         """
         Get all programs available from a specific utility provider.
         
@@ -276,34 +350,24 @@ class UtilityProgramService:
             utility_provider: The utility provider to get programs for
         
         Returns:
-            List of UtilityProgram objects
+            Shared tuple of UtilityProgram objects
         """
-        utility_name = utility_provider.name.lower()
-        
-        # Map utility names to program lists
-        if "southern california edison" in utility_name or "sce" in utility_name:
-            return self.db.SCE_PROGRAMS
-        elif "pacific gas and electric" in utility_name or "pg&e" in utility_name or "pge" in utility_name:
-            return self.db.PGE_PROGRAMS
-        elif "san diego gas" in utility_name or "sdg&e" in utility_name:
-            return self.db.SDGE_PROGRAMS
-        elif "los angeles department of water and power" in utility_name or "ladwp" in utility_name:
-            return self.db.LADWP_PROGRAMS
-        elif "southern california gas" in utility_name or "socalgas" in utility_name:
-            return self.db.SOCALGAS_PROGRAMS
-        elif "sacramento municipal" in utility_name or "smud" in utility_name:
-            return self.db.SMUD_PROGRAMS
-        elif "metropolitan water district" in utility_name or "mwd" in utility_name:
-            return self.db.MWD_PROGRAMS
+        # Known providers dispatch on their code; others are matched by name
+        if utility_provider.code is not None:
+            programs = _PROGRAMS_BY_UTILITY_CODE.get(utility_provider.code)
         else:
-            logger.warning(f"No programs found for utility: {utility_name}")
-            return []
+            programs = _match_utility_programs(utility_provider.name.lower())
+        
+        if programs is None:
+            logger.warning("No programs found for utility: %s", utility_provider.name.lower())
+            return ()
+        return programs
     
     def get_programs_by_category(
         self,
         utility_provider: UtilityProvider,
         category: ProgramCategory
-    ) -> List[UtilityProgram]:
+    ) -> Tuple[UtilityProgram, ...]:
         """
         Get programs from a utility filtered by category.
         
@@ -312,15 +376,20 @@ class UtilityProgramService:
             category: The program category to filter by
         
         Returns:
-            List of UtilityProgram objects matching the category
+            Tuple of UtilityProgram objects matching the category
         """
+        by_category = _PROGRAMS_BY_CATEGORY.get(utility_provider.code)
+        if by_category is not None:
+            return by_category.get(category, ())
+        
+        # Providers without programs in the code table are filtered by name
         all_programs = self.get_programs_for_utility(utility_provider)
-        return [p for p in all_programs if p.category == category]
+        return tuple(p for p in all_programs if p.category == category)
     
     def get_all_programs_for_address(
         self,
         utilities: Dict[str, Optional[UtilityProvider]]
-    ) -> Dict[str, List[UtilityProgram]]:
+    ) -> Dict[str, Tuple[UtilityProgram, ...]]:
         """
         Get all programs available for an address based on its utilities.
         
@@ -328,7 +397,7 @@ class UtilityProgramService:
             utilities: Dictionary of utility types to providers (from UtilityLookupService)
         
         Returns:
-            Dictionary mapping utility type to list of programs
+            Dictionary mapping utility type to a tuple of programs
         """
         result = {}
         
@@ -337,23 +406,31 @@ class UtilityProgramService:
                 programs = self.get_programs_for_utility(provider)
                 result[utility_type] = programs
             else:
-                result[utility_type] = []
+                result[utility_type] = ()
         
         return result
     
-    def format_programs_for_api(self, programs: List[UtilityProgram]) -> List[Dict]:
-        """Convert UtilityProgram objects to dictionary format for API response"""
-        return [
-            {
-                "name": p.name,
-                "category": p.category.value,
-                "description": p.description,
-                "rebate_amount": p.rebate_amount,
-                "eligibility": p.eligibility,
-                "application_url": p.application_url,
-                "phone": p.phone,
-                "income_qualified": p.income_qualified,
-                "notes": p.notes
-            }
-            for p in programs
-        ]
\ No newline at end of file
+    def format_programs_for_api(self, programs: Sequence[UtilityProgram]) -> List[Dict]:
+        """
+        Convert UtilityProgram objects to dictionary format for API response
+        Each program's entry is shared across calls; treat it as read-only
+        """
+        return [p.as_dict for p in programs]
+    
+    def format_programs_for_api_json(self, programs: Sequence[UtilityProgram]) -> bytes:
+        """Encode programs as the JSON array format_programs_for_api would produce, from pre-serialized entries"""
+        return b"[" + b",".join(p.as_json for p in programs) + b"]"
+    
+    def format_all_programs_for_api_json(self, utilities: Dict[str, Optional[UtilityProvider]]) -> bytes:
+        """
+        Encode the utility type -> programs object get_all_programs_for_address would produce, as JSON
+        Providers in the code table use their prebuilt array; others are resolved and joined here
+        """
+        parts = []
+        for utility_type, provider in utilities.items():
+            programs_json = _PROGRAMS_JSON_BY_UTILITY_CODE.get(provider.code) if provider else None
+            if programs_json is None:
+                programs = self.get_programs_for_utility(provider) if provider else ()
+                programs_json = self.format_programs_for_api_json(programs)
+            parts.append(f'"{utility_type}":'.encode("utf-8") + programs_json)
+        return b"{" + b",".join(parts) + b"}"
@@ -3,13 +3,20 @@
 
 import os
 import sys
+import random
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import AutoReconnect
 from dotenv import load_dotenv
 import asyncio
 
 # Load environment variables
 load_dotenv()
 
+# Transient DNS/TLS hiccups are retried with short, jittered backoff,
+# keeping the worst case close to the old single 5s attempt
+CONNECT_ATTEMPTS = 3
+SERVER_SELECTION_TIMEOUT_MS = 2000
+
 async def test_connection():
     """Test MongoDB connection and authentication"""
     mongo_uri = os.getenv("MONGO_URI")
@@ -23,19 +30,31 @@ async def test_connection():
     
     try:
         # Create client with shorter timeout for faster feedback
-        client = AsyncIOMotorClient(mongo_uri, serverSelectionTimeoutMS=5000)
+        client = AsyncIOMotorClient(mongo_uri, serverSelectionTimeoutMS=SERVER_SELECTION_TIMEOUT_MS)
         
-        # Test connection with ping
+        # Test connection with ping and list collections in parallel,
+        # so both share one server-selection wait instead of paying it twice
         print("🔄 Attempting to ping database...")
-        await client.admin.command('ping')
+        db = client.get_database("hocs")
+        for attempt in range(CONNECT_ATTEMPTS):
+            try:
+                _, collections = await asyncio.gather(
+                    client.admin.command('ping'),
+                    db.list_collection_names()
+                )
+                break
+            except AutoReconnect:
+                # Out of attempts: fall through to the diagnosis below
+                if attempt == CONNECT_ATTEMPTS - 1:
+                    raise
+                print(f"⚠️  Attempt {attempt + 1} of {CONNECT_ATTEMPTS} failed, retrying...")
+                await asyncio.sleep(0.2 * 2 ** attempt + random.random() * 0.1)
         print("✅ Successfully connected to MongoDB!")
         
         # Test database access
-        db = client.get_database("hocs")
         print(f"✅ Successfully accessed 'hocs' database")
         
         # List collections
-        collections = await db.list_collection_names()
         print(f"✅ Found {len(collections)} collections: {collections}")
         
         # Close connection
@@ -49,7 +68,8 @@ async def test_connection():
         print(f"Error message: {error_msg}")
         
         # Provide specific guidance based on error
-        if "authentication failed" in error_msg.lower():
+        error_lc = error_msg.lower()
+        if "authentication failed" in error_lc:
             print("\n🔍 DIAGNOSIS: Authentication Failed")
             print("Possible causes:")
             print("  1. Incorrect username or password in MONGO_URI")
@@ -61,7 +81,7 @@ async def test_connection():
             print("  • Reset password if needed and update .env file")
             print("  • Ensure user has 'readWrite' role on 'hocs' database")
             
-        elif "timeout" in error_msg.lower() or "timed out" in error_msg.lower():
+        elif "timeout" in error_lc or "timed out" in error_lc:
             print("\n🔍 DIAGNOSIS: Connection Timeout")
             print("Possible causes:")
             print("  1. IP address not whitelisted in MongoDB Atlas")
@@ -72,7 +92,7 @@ async def test_connection():
             print("  • Add your current IP or use 0.0.0.0/0 for testing")
             print("  • Verify cluster is active in MongoDB Atlas")
             
-        elif "dns" in error_msg.lower():
+        elif "dns" in error_lc:
             print("\n🔍 DIAGNOSIS: DNS Resolution Failed")
             print("Possible causes:")
             print("  1. Invalid cluster hostname in MONGO_URI")